@@ -1,19 +1,27 @@
-from re import finditer
+from re import compile as re_compile
 import praw
-from threading import Lock, Thread
-from queue import Queue, Empty
-from time import strftime
-from collections import defaultdict
-from itertools import product
+import numpy as np
+from threading import BoundedSemaphore, Lock, Thread, current_thread
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue, LifoQueue, Empty
+from time import strftime, monotonic
+from collections import Counter, OrderedDict, deque
+from itertools import islice
 from string import ascii_lowercase
-from json import dump, load
+from json import dumps, loads
 from logging import getLogger, basicConfig as lbasicConfig, INFO as lINFO
 import tkinter as tk
 from dotenv import load_dotenv
-from os import getenv
+from os import getenv, replace, fsync
+from os.path import exists
 import atexit
 from redis import Redis, ConnectionError, RedisError
-from pickle import dumps as pdumps
+import sqlite3
+
+try:
+    import orjson
+except ImportError:  # Fallback auf das langsamere json-Modul der Standardbibliothek
+    orjson = None
 
 # Logging Konfiguration
 lbasicConfig(
@@ -23,14 +31,46 @@ lbasicConfig(
 )
 logger = getLogger(__name__)
 
+# Regex Pattern für r/subreddit Erwähnungen, einmalig kompiliert
+SUBREDDIT_RE = re_compile(r'(?:^|\s)(?:/?r/|/r/)([a-zA-Z0-9_]+)')
+
+# Dateiendungen, für die statt JSON eine SQLite-Datenbank verwendet wird
+SQLITE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+
+# Formatkennung vor jedem Eintrag der Redis-Queue, 0x01 = UTF-8 JSON
+QUEUE_FORMAT_JSON = b"\x01"
+
+
+def _encode_json(obj, pretty=False):
+    """Serialisiert ein Objekt als UTF-8 JSON-Bytes, bevorzugt mit orjson"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return dumps(obj, indent=2).encode("utf-8")
+    return dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_json(data):
+    """Liest JSON aus Bytes oder Text, bevorzugt mit orjson"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return loads(data)
+
 
 def generate_search_terms(max_length=3):
     """
     Generiert Suchbegriffe systematisch.
+    Alle Kombinationen einer Länge entstehen in einem Schritt als kompaktes
+    NumPy-Array fester Breite (gleiche Reihenfolge wie itertools.product) und
+    werden blockweise in Python-Strings umgewandelt.
     """
+    letters = np.frombuffer(ascii_lowercase.encode(), dtype='S1')
+    chunk_size = 4096
     for length in range(1, max_length + 1):
-        for combo in product(ascii_lowercase, repeat=length):
-            yield ''.join(combo)
+        indices = np.indices((len(letters),) * length, dtype=np.uint8).reshape(length, -1).T
+        terms = np.ascontiguousarray(letters[indices]).view(f'S{length}').ravel()
+        for start in range(0, len(terms), chunk_size):
+            yield from terms[start:start + chunk_size].astype(f'U{length}').tolist()
 
 
 class CrawlerGUI:
@@ -64,7 +104,7 @@ class CrawlerGUI:
         )
         self.stop_button.grid(row=1, pady=10)
 
-        self.status_lines = []
+        self.status_lines = deque(maxlen=512)  # Neueste Zeile zuerst, ältere fallen heraus
         self.max_lines = 5
         self.thread_status = tk.Text(
             self.root,
@@ -76,6 +116,10 @@ class CrawlerGUI:
         self.thread_status.grid(row=2, padx=10, pady=10, sticky="nsew")
         self.thread_status.config(state='disabled')
 
+        # Neu gezeichnet wird nur, wenn sich der Inhalt tatsächlich geändert hat
+        self._dirty = False
+        self._resize_pending = False
+
         # Bind das Resize-Event
         self.root.bind('<Configure>', self.on_resize)
 
@@ -83,39 +127,55 @@ class CrawlerGUI:
         self.update_status()
 
     def on_resize(self, event):
+        """Fasst schnell aufeinanderfolgende Resize-Events zu einer Neuberechnung zusammen"""
+        if event.widget == self.root and not self._resize_pending:
+            self._resize_pending = True
+            self.root.after_idle(self._apply_resize)
+
+    def _apply_resize(self):
         """Passt die Anzahl der sichtbaren Zeilen basierend auf der Fenstergröße an"""
-        if event.widget == self.root:
-            # Berechne verfügbare Höhe für Text Widget
-            available_height = event.height - self.status_label.winfo_height() - self.stop_button.winfo_height() - 40
+        self._resize_pending = False
+
+        # Berechne verfügbare Höhe für Text Widget
+        available_height = (self.root.winfo_height() - self.status_label.winfo_height()
+                            - self.stop_button.winfo_height() - 40)
 
-            # Berechne Anzahl der möglichen Zeilen (1 Zeile ≈ 20 Pixel Höhe)
-            line_height = 20
-            self.max_lines = max(1, available_height // line_height)
+        # Berechne Anzahl der möglichen Zeilen (1 Zeile ≈ 20 Pixel Höhe)
+        line_height = 20
+        max_lines = max(1, available_height // line_height)
+        if max_lines != self.max_lines:
+            self.max_lines = max_lines
+            self._dirty = True
 
             # Update Text Widget
             self.update_text_content()
 
     def update_text_content(self):
         """Aktualisiert den Textinhalt basierend auf der aktuellen max_lines"""
+        if not self._dirty:
+            return
+
         self.thread_status.config(state='normal')
         self.thread_status.delete(1.0, tk.END)
 
         # Zeige nur so viele Zeilen an, wie in das Fenster passen
-        for line in self.status_lines[:self.max_lines]:
+        for line in islice(self.status_lines, self.max_lines):
             self.thread_status.insert(tk.END, line + '\n')
 
         self.thread_status.config(state='disabled')
+        self._dirty = False
 
     def add_status_line(self, new_line):
-        """Fügt eine neue Statuszeile hinzu"""
-        self.status_lines.insert(0, new_line)
+        """Fügt eine neue Statuszeile hinzu, sofern sie sich von der letzten unterscheidet"""
+        if self.status_lines and self.status_lines[0] == new_line:
+            return
+        self.status_lines.appendleft(new_line)
+        self._dirty = True
         self.update_text_content()
 
     def update_status(self):
         if hasattr(self.crawler, 'current_status'):
-            current_status = self.crawler.current_status
-            if not self.status_lines or current_status != self.status_lines[0]:
-                self.add_status_line(current_status)
+            self.add_status_line(self.crawler.current_status)
         self.root.after(1000, self.update_status)
 
     def stop_crawler(self):
@@ -135,68 +195,199 @@ class SaveManager(Thread):
     def __init__(self, save_path):
         super().__init__()
         self.save_path = save_path
+        self.wal_path = f"{save_path}.wal"
         self.save_queue = Queue()
         self.running = True
         self.daemon = True
         self.lock = Lock()
         self.backup_counter = 0
-        self.BACKUP_FREQUENCY = 10  # Backup alle 10 Speichervorgänge
+        self.BACKUP_FREQUENCY = 10  # Backup alle 10 Kompaktierungen
+        self.COMPACTION_INTERVAL = 30  # Sekunden zwischen zwei Kompaktierungen
+        self.COMPACTION_SIZE = 5000  # Spätestens nach so vielen Änderungen kompaktieren
+
+        # Daten werden einmalig geladen und danach nur noch im Speicher verändert
+        self.current_data = self._load_data()
+        self.pending_changes = 0
+        self.last_compaction = monotonic()
+
+        # Index Name -> Subreddit-Eintrag, verweist auf dieselben Objekte wie current_data
+        self.name_index = {}
+        for term_data in self.current_data["root"].values():
+            for subreddit in term_data["subreddits"]:
+                self.name_index[subreddit["name"]] = subreddit
+
+        # Änderungen aus einem abgebrochenen Lauf nachholen und sofort kompaktieren,
+        # damit neue Einträge nicht an eine abgebrochene letzte Zeile angehängt werden
+        self.wal = open(self.wal_path, "ab", buffering=1 << 20)
+        if self._replay_wal():
+            self._compact(sync=True)
+
+    def _load_data(self):
+        """Lädt den bestehenden Datenstand oder legt einen leeren an"""
+        try:
+            with open(self.save_path, "rb") as f:
+                return _decode_json(f.read())
+        except FileNotFoundError:
+            return {"root": {}, "metadata": {}}
+
+    def _replay_wal(self):
+        """
+        Spielt die seit der letzten Kompaktierung protokollierten Änderungen ein.
+        Gibt zurück, ob das WAL Einträge enthielt.
+        """
+        try:
+            with open(self.wal_path, "rb") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return False
+
+        items = []
+        for line in lines:
+            try:
+                items.append(_decode_json(line))
+            except ValueError:
+                # Unvollständige letzte Zeile nach einem Absturz
+                logger.warning("Überspringe beschädigten WAL-Eintrag")
+
+        # Bereits im Datenstand enthaltene Subreddits überspringt _add_new_subreddit
+        self._apply_batch(items)
+        logger.info(f"{len(items)} Einträge aus {self.wal_path} wiederhergestellt")
+        return bool(lines)
 
     def run(self):
         while self.running:
             try:
-                data_item = self.save_queue.get(timeout=1)
-                if data_item is None:
-                    break
+                batch = [self.save_queue.get(timeout=1)]
+            except Empty:
+                # Ruhephase nutzen, um fällige Änderungen zu kompaktieren
+                if self.pending_changes and self._compaction_due():
+                    self._compact()
+                continue
 
+            # Alle bereits wartenden Einträge in einem Durchgang abholen
+            while True:
                 try:
-                    with open(self.save_path, "r") as f:
-                        current_data = load(f)
-                except FileNotFoundError:
-                    current_data = {"root": {}, "metadata": {}}
+                    batch.append(self.save_queue.get_nowait())
+                except Empty:
+                    break
+
+            self._append_to_wal(batch)
+            shutdown = self._apply_batch(batch)
+            if shutdown:
+                break
+
+            if self._compaction_due():
+                self._compact()
+
+        # Restliche Einträge übernehmen und ein letztes Mal speichern
+        remaining = []
+        while True:
+            try:
+                remaining.append(self.save_queue.get_nowait())
+            except Empty:
+                break
+        self._append_to_wal(remaining)
+        self._apply_batch(remaining)
+        if self.pending_changes:
+            self._compact(sync=True)
+        self.wal.close()
+
+    def _compaction_due(self):
+        return (self.pending_changes >= self.COMPACTION_SIZE
+                or monotonic() - self.last_compaction >= self.COMPACTION_INTERVAL)
+
+    def _append_to_wal(self, batch):
+        """Hängt einen Batch als JSON-Zeilen mit einem einzigen Schreibvorgang an das WAL an"""
+        records = [_encode_json(data_item) for data_item in batch if data_item is not None]
+        if not records:
+            return
 
+        try:
+            self.wal.write(b"\n".join(records) + b"\n")
+            self.wal.flush()
+        except Exception as e:
+            logger.error(f"Fehler beim Schreiben des WAL: {e}")
+
+    def _apply_batch(self, batch):
+        """Wendet einen Batch von Queue-Einträgen auf die Daten im Speicher an"""
+        shutdown = False
+        for data_item in batch:
+            if data_item is None:
+                shutdown = True
+                continue
+
+            try:
                 if data_item.get("type") == "update":
-                    self._update_subreddit_data(current_data, data_item["data"])
+                    self._update_subreddit_data(self.current_data, data_item["data"])
                 else:
                     self._add_new_subreddit(
-                        current_data,
+                        self.current_data,
                         data_item["search_term"],
                         data_item["subreddit_data"]
                     )
-
-                current_data["metadata"]["last_update"] = strftime("%Y-%m-%d %H:%M:%S")
-
-                with open(self.save_path, "w") as f:
-                    dump(current_data, f, indent=2)
-
-                # Backup nur periodisch erstellen
-                self.backup_counter += 1
-                if self.backup_counter >= self.BACKUP_FREQUENCY:
-                    with open(f"{self.save_path}.backup", "w") as f:
-                        dump(current_data, f, indent=2)
-                    self.backup_counter = 0
-
-            except Empty:
-                continue
+                self.pending_changes += 1
             except Exception as e:
-                logger.error(f"Fehler beim Speichern: {e}")
+                logger.error(f"Fehler beim Verarbeiten eines Eintrags: {e}")
+        return shutdown
+
+    def _compact(self, sync=False):
+        """
+        Schreibt den kompletten Datenstand und leert anschließend das WAL.
+        Mit sync=True wird die Datei vor dem Umbenennen auf die Platte gezwungen.
+        """
+        try:
+            self.current_data["metadata"]["last_update"] = strftime("%Y-%m-%d %H:%M:%S")
+
+            self._write_atomic(self.save_path, _encode_json(self.current_data), sync)
+
+            # Erst nach erfolgreichem Schreiben sind die WAL-Einträge überflüssig
+            self.wal.truncate(0)
+
+            # Backup nur periodisch erstellen, bleibt für Menschen lesbar formatiert
+            self.backup_counter += 1
+            if self.backup_counter >= self.BACKUP_FREQUENCY:
+                self._write_atomic(
+                    f"{self.save_path}.backup",
+                    _encode_json(self.current_data, pretty=True),
+                    sync
+                )
+                self.backup_counter = 0
+            self.pending_changes = 0
+        except Exception as e:
+            logger.error(f"Fehler beim Speichern: {e}")
+        finally:
+            self.last_compaction = monotonic()
+
+    @staticmethod
+    def _write_atomic(target_path, data, sync=False):
+        """Schreibt in eine temporäre Datei und ersetzt das Ziel per atomarem Rename"""
+        tmp_path = f"{target_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            if sync:
+                f.flush()
+                fsync(f.fileno())
+        replace(tmp_path, target_path)
 
     def _update_subreddit_data(self, current_data, update_data):
         """Aktualisiert Daten eines existierenden Subreddits"""
-        for search_term in current_data["root"]:
-            for subreddit in current_data["root"][search_term]["subreddits"]:
-                if subreddit["name"] == update_data["name"]:
-                    # Behalte NSFW-Status bei Update bei
-                    nsfw_status = subreddit.get("nsfw", False)
-                    subreddit.update({
-                        "related_subreddits": update_data["related_subreddits"],
-                        "related_count": update_data["related_count"],
-                        "nsfw": nsfw_status  # Behalte NSFW-Status
-                    })
-                    return
+        subreddit = self.name_index.get(update_data["name"])
+        if subreddit is None:
+            return
+
+        # Behalte NSFW-Status bei Update bei
+        nsfw_status = subreddit.get("nsfw", False)
+        subreddit.update({
+            "related_subreddits": update_data["related_subreddits"],
+            "related_count": update_data["related_count"],
+            "nsfw": nsfw_status  # Behalte NSFW-Status
+        })
 
     def _add_new_subreddit(self, current_data, search_term, subreddit_data):
-        """Fügt einen neuen Subreddit hinzu"""
+        """Fügt einen neuen Subreddit hinzu, bereits gespeicherte Namen werden übersprungen"""
+        if subreddit_data["name"] in self.name_index:
+            return
+
         if search_term not in current_data["root"]:
             current_data["root"][search_term] = {"subreddits": []}
 
@@ -204,9 +395,136 @@ class SaveManager(Thread):
             subreddit_data["nsfw"] = True
 
         current_data["root"][search_term]["subreddits"].append(subreddit_data)
+        self.name_index[subreddit_data["name"]] = subreddit_data
 
     def stop(self):
-        """Stoppt den SaveManager sauber"""
+        """Stoppt den SaveManager sauber, ausstehende Änderungen werden beim Beenden gespeichert"""
+        self.running = False
+        self.save_queue.put(None)  # Sende Shutdown Signal
+
+
+class SQLiteSaveManager(Thread):
+    """
+    Alternative zum SaveManager, die jede Änderung inkrementell in eine
+    SQLite-Datenbank im WAL-Modus schreibt. Wird verwendet, wenn
+    SAVE_DATA_PATH auf .db, .sqlite oder .sqlite3 endet.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS subreddits (
+            name TEXT PRIMARY KEY,
+            search_term TEXT NOT NULL,
+            search_term_count INTEGER NOT NULL DEFAULT 1,
+            related_count INTEGER NOT NULL DEFAULT 0,
+            nsfw INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS related (
+            src TEXT NOT NULL,
+            dst TEXT NOT NULL,
+            PRIMARY KEY (src, dst)
+        );
+        CREATE TABLE IF NOT EXISTS metadata (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+
+    def __init__(self, save_path):
+        super().__init__()
+        self.save_path = save_path
+        self.save_queue = Queue()
+        self.running = True
+        self.daemon = True
+
+    def run(self):
+        # Die Verbindung gehört ausschließlich diesem Thread
+        conn = sqlite3.connect(self.save_path, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(self.SCHEMA)
+
+            while self.running:
+                try:
+                    batch = [self.save_queue.get(timeout=1)]
+                except Empty:
+                    continue
+
+                # Alle bereits wartenden Einträge in einer Transaktion schreiben
+                while True:
+                    try:
+                        batch.append(self.save_queue.get_nowait())
+                    except Empty:
+                        break
+
+                if self._write_batch(conn, batch):
+                    break
+
+            # Restliche Einträge übernehmen
+            remaining = []
+            while True:
+                try:
+                    remaining.append(self.save_queue.get_nowait())
+                except Empty:
+                    break
+            self._write_batch(conn, remaining)
+        except sqlite3.Error as e:
+            logger.error(f"Fehler beim Öffnen der Datenbank {self.save_path}: {e}")
+        finally:
+            conn.close()
+
+    def _write_batch(self, conn, batch):
+        """Schreibt einen Batch von Queue-Einträgen in einer einzigen Transaktion"""
+        shutdown = False
+        items = []
+        for data_item in batch:
+            if data_item is None:
+                shutdown = True
+            else:
+                items.append(data_item)
+        if not items:
+            return shutdown
+
+        try:
+            conn.execute("BEGIN")
+            for data_item in items:
+                if data_item.get("type") == "update":
+                    update_data = data_item["data"]
+                    conn.execute(
+                        "UPDATE subreddits SET related_count = ? WHERE name = ?",
+                        (update_data["related_count"], update_data["name"])
+                    )
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO related (src, dst) VALUES (?, ?)",
+                        [(update_data["name"], related) for related in update_data["related_subreddits"]]
+                    )
+                else:
+                    subreddit_data = data_item["subreddit_data"]
+                    conn.execute(
+                        "INSERT OR IGNORE INTO subreddits "
+                        "(name, search_term, search_term_count, related_count, nsfw) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (
+                            subreddit_data["name"],
+                            data_item["search_term"],
+                            subreddit_data["search_term_count"],
+                            subreddit_data["related_count"],
+                            int(bool(subreddit_data.get("nsfw")))
+                        )
+                    )
+            conn.execute(
+                "INSERT OR REPLACE INTO metadata (key, value) VALUES ('last_update', ?)",
+                (strftime("%Y-%m-%d %H:%M:%S"),)
+            )
+            conn.execute("COMMIT")
+        except (sqlite3.Error, KeyError) as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.error(f"Fehler beim Speichern in die Datenbank: {e}")
+        return shutdown
+
+    def stop(self):
+        """Stoppt den SaveManager sauber, ausstehende Änderungen werden beim Beenden gespeichert"""
         self.running = False
         self.save_queue.put(None)  # Sende Shutdown Signal
 
@@ -227,31 +545,39 @@ class RedditCrawler:
 
         self.current_status = "Initialisierung..."
         if search_terms is None:
+            # Suchbegriffe werden erst beim Einreichen in den Pool erzeugt
             max_length = int(getenv('SEARCH_TERM_LENGTH', "1"))
-            search_terms = list(generate_search_terms(max_length=max_length))
+            term_count = sum(len(ascii_lowercase) ** length for length in range(1, max_length + 1))
+            search_terms = generate_search_terms(max_length=max_length)
         else:
             search_terms = list(search_terms)
+            term_count = len(search_terms)
 
-        if not search_terms:
+        if not term_count:
             raise ValueError("Keine Suchbegriffe vorhanden")
 
-        # Direkte Aufteilung ohne separate Längen-Variable
-        middle = len(search_terms) // 2
-        self.first_half = search_terms[:middle]
-        self.second_half = search_terms[middle:]
-
-        self.subreddit_queue = Queue()
-        self.results = defaultdict(int)
-        self.connections = defaultdict(lambda: defaultdict(int))
-        self.processed_subreddits = set()
+        # Alle Suchbegriffe werden über einen gemeinsamen Thread-Pool abgearbeitet
+        self.search_terms = search_terms
+        self.SEARCH_WORKERS = max(1, int(getenv('SEARCH_WORKERS', "8")))
+        self.RELATED_WORKERS = max(1, int(getenv('RELATED_WORKERS', "4")))
+
+        # LIFO: zuletzt gefundene Subreddits werden zuerst weiterverarbeitet
+        self.subreddit_queue = LifoQueue()
+        # Ungerichtete Kanten als sortiertes Namens-Tupel -> Anzahl der Erwähnungen
+        self.edges = Counter()
+        # Name -> Token des Aufrufs, der ihn zuerst beansprucht hat
+        self.processed_subreddits = {}
         self.lock = Lock()
         self.running = True
 
-        self.last_processed = {
-            'thread1': None,
-            'thread2': None,
-            'related_thread': None
-        }
+        # Metadaten (Typ, Beschreibung, NSFW) aus den Suchergebnissen, damit die
+        # Related-Worker den Subreddit nicht erneut abrufen müssen
+        self.META_CACHE_SIZE = 4096
+        self._meta_cache = OrderedDict()
+        self._meta_lock = Lock()
+
+        # Zuletzt bearbeiteter Suchbegriff je Worker-Thread
+        self.last_processed = {}
 
         # Initialize Redis connection
         self.use_server = use_server
@@ -263,20 +589,51 @@ class RedditCrawler:
             # Clear any existing data in the queue
             self.redis_client.delete(self.graph_queue)
 
-        # Initialisiere SaveManager
-        self.save_manager = SaveManager(self.SAVE_PATH)
+        # Initialisiere SaveManager, Datenbankdateien werden per SQLite geschrieben
+        if self.SAVE_PATH.endswith(SQLITE_SUFFIXES):
+            self.save_manager = SQLiteSaveManager(self.SAVE_PATH)
+        else:
+            self.save_manager = SaveManager(self.SAVE_PATH)
 
         atexit.register(self.cleanup)
-        logger.info(f"Reddit Crawler initialisiert mit {middle} Suchbegriffen")
+        logger.info(f"Reddit Crawler initialisiert mit {term_count} Suchbegriffen")
+
+    @property
+    def results(self):
+        """Wie oft jeder Subreddit als verwandt erwähnt wurde, abgeleitet aus self.edges"""
+        results = Counter()
+        with self.lock:
+            for edge, count in self.edges.items():
+                for node in edge:
+                    if node.startswith("r/"):
+                        results[node] += count
+        return results
+
+    def _remember_meta(self, name, meta):
+        """Legt Metadaten ab, bei vollem Cache fallen die ältesten Einträge heraus"""
+        with self._meta_lock:
+            self._meta_cache[name] = meta
+            if len(self._meta_cache) > self.META_CACHE_SIZE:
+                self._meta_cache.popitem(last=False)
+
+    def _take_meta(self, name):
+        """Entnimmt die Metadaten eines Subreddits, jeder Name wird nur einmal verarbeitet"""
+        with self._meta_lock:
+            return self._meta_cache.pop(name, None)
 
     def setup_redis_connection(self):
         """Establishes connection to Redis with error handling"""
         try:
+            # Unix-Socket bevorzugen, falls REDIS_SOCK gesetzt ist und existiert, sonst TCP
+            socket_path = getenv('REDIS_SOCK')
             self.redis_client = Redis(
+                unix_socket_path=socket_path if socket_path and exists(socket_path) else None,
                 host='localhost',
                 port=6379,
                 db=0,
-                socket_connect_timeout=5
+                socket_connect_timeout=5,
+                socket_keepalive=True,
+                health_check_interval=30
             )
             # Test the connection
             self.redis_client.ping()
@@ -297,49 +654,71 @@ class RedditCrawler:
             # Suche nach Subreddits mit PRAW
             subreddits = self.reddit.subreddits.search(search_term, limit=int(getenv('SEARCH_LIMIT', 10)))
 
+            # Listing zuerst vollständig abrufen, danach lösen die Attribute
+            # keine HTTP-Anfragen mehr aus
+            listing = []
             for subreddit in subreddits:
                 if not self.running:
                     break
+                listing.append((
+                    subreddit.display_name,
+                    subreddit.over18,
+                    subreddit.subreddit_type,
+                    subreddit.description
+                ))
+
+            # Redis-Befehle sammeln und gemeinsam in einem Roundtrip senden
+            pipe = None
+            if self.use_server and self.redis_client:
+                pipe = self.redis_client.pipeline(transaction=False)
+
+            # dict.setdefault ist unter dem GIL atomar: genau ein Worker beansprucht
+            # jeden Namen, alle anderen erhalten das fremde Token zurück
+            token = object()
+            for name, over18, subreddit_type, description in listing:
+                if self.processed_subreddits.setdefault(name, token) is not token:
+                    continue
+
+                # Bereite Daten für die Speicherung vor
+                subreddit_data = {
+                    "name": name,
+                    "search_term_count": 1,
+                    "related_count": 0,
+                    "related_subreddits": [],
+                    "nsfw": over18
+                }
+
+                # Sende an Save-Queue
+                self.save_manager.save_queue.put({
+                    "type": "new",  # Kennzeichnung für neuen Subreddit
+                    "search_term": search_term,
+                    "subreddit_data": subreddit_data
+                })
+
+                # Füge zur Verarbeitung hinzu, die Metadaten aus dem Listing werden mitgegeben
+                self._remember_meta(name, (subreddit_type, description, over18))
+                self.subreddit_queue.put((name, search_term))
+
+                if pipe is not None:
+                    # Gleiche Felder wie im Speicherformat, damit der Visualizer nicht prüfen muss
+                    graph_data = {
+                        "name": name,
+                        "search_term": search_term,
+                        "search_term_count": 1,
+                        "related_count": 0,
+                        "related_subreddits": [],
+                        "nsfw": over18
+                    }
+                    # Graph-Einträge gehen mit Formatkennung als JSON an die Queue (siehe visualization.py)
+                    pipe.rpush(self.graph_queue, QUEUE_FORMAT_JSON + _encode_json(graph_data))
+
+            if pipe is not None and len(pipe):
+                try:
+                    pipe.execute()
+                except RedisError as e:
+                    logger.error(f"Redis error during search: {e}")
 
-                with self.lock:
-                    if subreddit.display_name not in self.processed_subreddits:
-                        # Bereite Daten für die Speicherung vor
-                        subreddit_data = {
-                            "name": subreddit.display_name,
-                            "search_term_count": 1,
-                            "related_count": 0,
-                            "related_subreddits": [],
-                            "nsfw": subreddit.over18
-                        }
-
-                        # Sende an Save-Queue
-                        self.save_manager.save_queue.put({
-                            "type": "new",  # Kennzeichnung für neuen Subreddit
-                            "search_term": search_term,
-                            "subreddit_data": subreddit_data
-                        })
-
-                        # Füge zur Verarbeitung hinzu
-                        self.subreddit_queue.put(subreddit.display_name)
-                        self.processed_subreddits.add(subreddit.display_name)
-
-                        if self.use_server and self.redis_client:
-                            try:
-                                graph_data = {
-                                    "node": subreddit.display_name,
-                                    "weight": 1,
-                                    "nsfw": subreddit.over18,
-                                    "search_term": search_term
-                                }
-                                self.redis_client.rpush(
-                                    self.graph_queue,
-                                    pdumps(graph_data)
-                                )
-                            except RedisError as e:
-                                logger.error(f"Redis error during search: {e}")
-
-            with self.lock:
-                self.last_processed[thread_name] = search_term
+            self.last_processed[thread_name] = search_term
 
             logger.info(f"Suche für {search_term} abgeschlossen")
 
@@ -348,25 +727,28 @@ class RedditCrawler:
             self.last_processed[thread_name] = f"ERROR: {search_term}"
 
     def process_related_subreddits(self):
-        # Regex Pattern für r/subreddit Erwähnungen
-        subreddit_pattern = r'(?:^|\s)(?:/?r/|/r/)([a-zA-Z0-9_]+)'
-
         while self.running:
             try:
-                subreddit_name = self.subreddit_queue.get(timeout=10)
+                subreddit_name, search_term = self.subreddit_queue.get(timeout=10)
                 self.current_status = f"🔗 Verarbeite verwandte Subreddits für: {subreddit_name}"
 
                 try:
-                    subreddit = self.reddit.subreddit(subreddit_name)
-                    if not subreddit.subreddit_type == 'public':
+                    meta = self._take_meta(subreddit_name)
+                    if meta is None:
+                        # Nicht (mehr) im Cache, Metadaten einzeln abrufen
+                        subreddit = self.reddit.subreddit(subreddit_name)
+                        meta = (subreddit.subreddit_type, subreddit.description, subreddit.over18)
+                    subreddit_type, description, over18 = meta
+
+                    if not subreddit_type == 'public':
                         continue
-                    description = subreddit.description
+                    description = description or ""
 
                     # Finde alle Subreddit Erwähnungen mit Regex
-                    related_subs = set(
+                    related_subs = {
                         f"r/{match.group(1)}"
-                        for match in finditer(subreddit_pattern, description)
-                    )
+                        for match in SUBREDDIT_RE.finditer(description)
+                    }
 
                     # Filtere den aktuellen Subreddit aus den Related heraus
                     related_subs.discard(f"r/{subreddit_name}")
@@ -377,7 +759,7 @@ class RedditCrawler:
                             "name": subreddit_name,
                             "related_subreddits": list(related_subs),
                             "related_count": len(related_subs),
-                            "nsfw": subreddit.over18  # NSFW-Status hinzufügen
+                            "nsfw": over18  # NSFW-Status hinzufügen
                         }
 
                         # Sende Update an SaveManager
@@ -389,25 +771,28 @@ class RedditCrawler:
                         if self.use_server and self.redis_client:
                             try:
                                 graph_data = {
-                                    "node": subreddit_name,
-                                    "connections": list(related_subs),
-                                    "nsfw": subreddit.over18
+                                    "name": subreddit_name,
+                                    "search_term": search_term,
+                                    "related_subreddits": update_data["related_subreddits"],
+                                    "related_count": update_data["related_count"],
+                                    "nsfw": over18
                                 }
                                 self.redis_client.rpush(
                                     self.graph_queue,
-                                    pdumps(graph_data)
+                                    QUEUE_FORMAT_JSON + _encode_json(graph_data)
                                 )
                             except RedisError as e:
                                 logger.error(f"Redis error in related processing: {e}")
 
-                    for related_name in related_subs:
-                        if not self.running:
-                            break
-
+                    # Kanten lokal zählen und einmalig pro Subreddit übernehmen
+                    local_edges = Counter(
+                        (subreddit_name, related_name) if subreddit_name < related_name
+                        else (related_name, subreddit_name)
+                        for related_name in related_subs
+                    )
+                    if local_edges:
                         with self.lock:
-                            self.connections[subreddit_name][related_name] += 1
-                            self.connections[related_name][subreddit_name] += 1
-                            self.results[related_name] += 1
+                            self.edges.update(local_edges)
 
                 except Exception as e:
                     logger.warning(f"Fehler beim finden von Related Subreddits bei {subreddit_name}: {e}")
@@ -436,34 +821,42 @@ class RedditCrawler:
                 logger.error(f"An error occurred during cleanup: {e}")
 
         # Leere alle Datenstrukturen
-        self.results.clear()
-        self.connections.clear()
+        self.edges.clear()
+        with self._meta_lock:
+            self._meta_cache.clear()
         self.processed_subreddits.clear()
 
-        # Leere die Queue
-        while not self.subreddit_queue.empty():
-            try:
-                self.subreddit_queue.get_nowait()
-            except Empty:
-                break
+        # Leere die Queue in einem Schritt unter ihrem eigenen Mutex
+        with self.subreddit_queue.mutex:
+            self.subreddit_queue.queue.clear()
+            self.subreddit_queue.unfinished_tasks = 0
+            self.subreddit_queue.all_tasks_done.notify_all()
 
         # Setze alle relevanten Variablen zurück
-        self.last_processed = {
-            'thread1': None,
-            'thread2': None,
-            'related_thread': None
-        }
+        self.last_processed = {}
 
         self.running = False
         self.current_status = "Beendet"
         logger.info("Cleanup abgeschlossen")
 
-    def search_worker(self, search_terms, thread_name):
-        """Worker-Thread für die Suche"""
-        for term in search_terms:
+    def search_worker(self, search_term):
+        """Aufgabe im Such-Pool, bearbeitet einen einzelnen Suchbegriff"""
+        if not self.running:
+            return
+        self.search_subreddits(search_term, current_thread().name)
+
+    def _feed_search_pool(self, search_pool):
+        """Reicht die Suchbegriffe nach und nach an den Pool weiter"""
+        # Höchstens zwei Suchbegriffe pro Worker warten gleichzeitig im Pool
+        slots = BoundedSemaphore(self.SEARCH_WORKERS * 2)
+
+        for term in self.search_terms:
+            while self.running and not slots.acquire(timeout=1):
+                pass
             if not self.running:
                 break
-            self.search_subreddits(term, thread_name)
+            future = search_pool.submit(self.search_worker, term)
+            future.add_done_callback(lambda _: slots.release())
 
     def start_crawling(self):
         """Startet den Crawling-Prozess"""
@@ -473,28 +866,38 @@ class RedditCrawler:
 
         self.save_manager.start()
 
-        search_thread1 = Thread(
-            target=self.search_worker,
-            args=(self.first_half, "thread1")
+        search_pool = ThreadPoolExecutor(
+            max_workers=self.SEARCH_WORKERS,
+            thread_name_prefix="search"
         )
-        search_thread2 = Thread(
-            target=self.search_worker,
-            args=(self.second_half, "thread2")
-        )
-        related_thread = Thread(
-            target=self.process_related_subreddits
+        feeder_thread = Thread(
+            target=self._feed_search_pool,
+            args=(search_pool,)
         )
+        # Mehrere Worker teilen sich die Queue der verwandten Subreddits
+        related_threads = [
+            Thread(
+                target=self.process_related_subreddits,
+                name=f"related_{i}"
+            )
+            for i in range(self.RELATED_WORKERS)
+        ]
 
-        logger.info("Threads werden gestartet")
-        search_thread1.start()
-        search_thread2.start()
-        related_thread.start()
+        logger.info(
+            f"Threads werden gestartet ({self.SEARCH_WORKERS} Such-Worker, "
+            f"{self.RELATED_WORKERS} Related-Worker)"
+        )
+        feeder_thread.start()
+        for related_thread in related_threads:
+            related_thread.start()
 
         gui.root.mainloop()
 
-        search_thread1.join()
-        search_thread2.join()
-        related_thread.join()
+        feeder_thread.join()
+        # Nach dem Stoppen noch nicht begonnene Suchen verwerfen
+        search_pool.shutdown(wait=True, cancel_futures=not self.running)
+        for related_thread in related_threads:
+            related_thread.join()
 
         self.cleanup()
         logger.info("Crawling-Prozess abgeschlossen")
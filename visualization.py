@@ -1,18 +1,48 @@
 from argparse import ArgumentParser
-from json import dumps, dump, load as json_load, JSONDecodeError
+from json import dumps, JSONDecodeError
 from functools import partial, lru_cache
-from redis import Redis, ConnectionError
-import pickle
+from contextlib import contextmanager, nullcontext
+from collections import Counter
+from array import array
+from redis import Redis, ConnectionPool, UnixDomainSocketConnection, ConnectionError, ResponseError
 from pyvis.network import Network
 from time import sleep, time
-from logging import getLogger, basicConfig as loggingConfig, INFO as LOG_INFO
+from random import random
+from logging import getLogger, basicConfig as loggingConfig, INFO as LOG_INFO, DEBUG as LOG_DEBUG
 import http.server
 import socketserver
 import json
 from webbrowser import open as webb_open
-from os import path, makedirs
-from threading import Thread
-from typing import Dict, Set, List, Tuple, Optional, Any
+from os import path, makedirs, remove, replace, stat, fstat, fdopen, fchmod, getenv, cpu_count
+from stat import S_ISDIR
+from queue import Queue, Empty
+from itertools import count
+import gzip
+from base64 import b64decode
+from threading import Lock, Thread
+from hashlib import blake2b
+from concurrent.futures import ThreadPoolExecutor
+import sqlite3
+from glob import glob
+from tempfile import mkstemp
+from typing import Callable, Dict, Iterator, Set, FrozenSet, List, Tuple, Optional, Any, BinaryIO, Union
+
+try:
+    import orjson
+except ImportError:  # Fallback auf das json-Modul der Standardbibliothek
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # Größen werden dann in reinem Python skaliert
+    np = None
+
+try:
+    from networkx import Graph as NxGraph
+    from networkx.algorithms.community import louvain_communities
+except ImportError:  # Ohne networkx werden große Exporte nicht zusammengefasst
+    NxGraph = None
+    louvain_communities = None
 
 # Configure logging
 loggingConfig(
@@ -22,6 +52,382 @@ loggingConfig(
 )
 logger = getLogger(__name__)
 
+# Dateiendungen, die als SQLite-Datenbank des Crawlers gelesen werden
+SQLITE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+
+# Formatkennung am Anfang jedes Queue-Eintrags (muss zu main.py passen)
+QUEUE_FORMAT_JSON = b"\x01"
+
+# Knotengrößen der Visualisierung
+MIN_NODE_SIZE = 10
+MAX_NODE_SIZE = 100
+MAX_NODE_WEIGHT = 1000
+
+# Standard-Konfiguration für alle PyVis-Netzwerke, einmalig als JSON serialisiert
+NETWORK_OPTIONS_JSON = dumps({
+    "configure": {
+        "enabled": False
+    },
+    "physics": {
+        "enabled": True,
+        "solver": "forceAtlas2Based",  # Barnes-Hut eignet sich in der Regel besser für große Netzwerke
+        "forceAtlas2Based": {
+            "gravitationalConstant": -50,  # Niedrigere negative Kraft für sanftere Abstoßung
+            "centralGravity": 0.01, # Sehr schwache Zentralanziehung, damit Cluster nicht zu stark zusammenfallen
+            "springLength": 150,  # Etwas längere Federn für mehr Abstand zwischen den Nodes
+            "springConstant": 0.08,  # Etwas höhere Federkonstante für stabilere Verbindungen
+            "damping": 0.4,  # Erhöhtes Dämpfungsverhalten, um das Oszillieren zu reduzieren
+            "avoidOverlap": 4  # Leicht erhöhen, um Überschneidungen zu minimieren
+        },
+        "stabilization": {
+            "enabled": True,
+            "iterations": 1000,
+            "updateInterval": 100
+        },
+        "minVelocity": 0.1,
+        "maxVelocity": 50
+    },
+    "nodes": {
+        "scaling": {
+            "min": 10,
+            "max": 100
+        },
+        "shadow": {
+            "enabled": True,
+            "size": 15
+        },
+        "font": {
+            "size": 12,
+            "face": "Arial"
+        }
+    },
+    "edges": {
+        "smooth": {
+            "enabled": False,
+            "type": "dynamic"  # Dynamische Kanten können den Fluss des Netzwerks besser betonen
+        },
+        "color": {
+            "inherit": "from"  # Kantenfarbe von den verbundenen Knoten erben
+        },
+        "width": 1.5
+    },
+    "interaction": {
+        "hideEdgesOnDrag": True,
+        "tooltipDelay": 100
+    }
+})
+
+# Optionen der Label-Ansicht für den Bildexport, ebenfalls einmalig serialisiert
+LABELED_OPTIONS_JSON = dumps({
+    "physics": {
+        "enabled": True,
+        "solver": "forceAtlas2Based",  # Better solver for layout
+        "forceAtlas2Based": {
+            "gravitationalConstant": -50,
+            "centralGravity": 0.005,
+            "springLength": 250,
+            "springConstant": 0.05,
+            "damping": 0.4,
+            "avoidOverlap": 1.0
+        },
+        "stabilization": {
+            "enabled": True,
+            "iterations": 2500,
+            "updateInterval": 25
+        },
+        "minVelocity": 0.5,
+        "maxVelocity": 50
+    },
+    "nodes": {
+        "font": {
+            "size": 24,
+            "face": "Arial",
+            "color": "white",
+            "strokeWidth": 2,
+            "strokeColor": "#222222"
+        },
+        "scaling": {
+            "min": 30,
+            "max": 80
+        },
+        "shape": "box",
+        "margin": 15,
+        "widthConstraint": {
+            "maximum": 150
+        },
+        "borderWidth": 2
+    },
+    "edges": {
+        "color": {
+            "opacity": 0.7
+        },
+        "smooth": {
+            "enabled": True,
+            "type": "continuous"
+        },
+        "width": 1.5
+    },
+    "layout": {
+        "improvedLayout": True  # Disable for better performance
+    }
+}, separators=(',', ':'))
+
+
+# Wird vor jedem Seitenaufruf im Export-Browser ausgeführt und setzt window.__STAB__,
+# sobald vis.js die Stabilisierung abgeschlossen hat (oder sie schon beendet war)
+STABILIZATION_HOOK_JS = """
+window.__STAB__ = false;
+document.addEventListener('DOMContentLoaded', () => {
+    const network = window.network;
+    if (!network) { return; }
+    if (network.physics && network.physics.stabilized) { window.__STAB__ = true; }
+    network.on('stabilizationIterationsDone', () => { window.__STAB__ = true; });
+});
+"""
+
+# Abfrage der Wartebedingung, die Physik-Prüfung greift, falls der Hook fehlt
+STABILIZATION_DONE_JS = (
+    "return window.__STAB__ === true"
+    " || !!(window.network && window.network.physics && window.network.physics.stabilized);"
+)
+
+
+# Rahmen der kombinierten Ansicht für das WebGL-Backend (sigma.js). Knoten und
+# Kanten werden als JSON zwischen Kopf und Ende eingesetzt, das Layout berechnet
+# ForceAtlas2 im Browser.
+SIGMA_HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="UTF-8">
+<script src="https://cdn.jsdelivr.net/npm/graphology@0.25.4/dist/graphology.umd.min.js"></script>
+<script src="https://cdn.jsdelivr.net/npm/graphology-library@0.8.0/dist/graphology-library.min.js"></script>
+<script src="https://cdn.jsdelivr.net/npm/sigma@2.4.0/build/sigma.min.js"></script>
+<style>
+html, body { margin: 0; height: 100%; background-color: #222222; }
+#graph { width: 100%; height: 100vh; }
+</style>
+</head>
+<body>
+<div id="graph"></div>
+<script>
+"""
+
+SIGMA_HTML_TAIL = """
+const graph = new graphology.Graph();
+nodes.forEach(n => graph.addNode(n.id, {
+    label: n.label, size: (n.size || 10) / 4, color: n.color,
+    x: Math.random(), y: Math.random()
+}));
+edges.forEach(e => graph.mergeEdge(e.from, e.to, {color: "#ffffff", size: 0.5}));
+graphologyLibrary.layoutForceAtlas2.assign(graph, {
+    iterations: 200,
+    settings: graphologyLibrary.layoutForceAtlas2.inferSettings(graph)
+});
+window.renderer = new Sigma(graph, document.getElementById("graph"), {labelColor: {color: "#ffffff"}});
+// Für den Bildexport: das Layout ist fertig berechnet
+window.__STAB__ = true;
+</script>
+"""
+
+# Ab dieser Knotenzahl fasst die Label-Ansicht Communities zu Meta-Knoten zusammen,
+# darüber wird vis.js im Browser zu langsam
+LABELED_MAX_NODES = 3000
+
+# Label-Exporte, die älter sind, werden beim Start gelöscht (Sekunden)
+LABELED_EXPORT_MAX_AGE = 7 * 24 * 3600
+
+# Knotenfarbe nach NSFW-Status: Index False -> grün, True -> rot
+_NODE_COLOR = ("#00ff00", "#ff0000")
+
+
+@lru_cache(maxsize=4096)
+def _node_title(related_count: int, search_term_count: int, is_nsfw: bool) -> str:
+    """Erstellt den Tooltip-Text eines Knotens, gleiche Kennzahlen kommen aus dem Cache"""
+    return (f"Related count: {related_count}\n"
+            f"Search term count: {search_term_count}\n"
+            f"NSFW: {is_nsfw}")
+
+
+# Ersetzt alle ASCII-Zeichen außer Buchstaben und Ziffern durch '_'
+_SAFE_NAME_TABLE = str.maketrans({
+    c: '_' for c in map(chr, range(128)) if not c.isalnum()
+})
+
+
+@lru_cache(maxsize=65536)
+def _safe_name(search_term: str) -> str:
+    """Bereinigt einen Suchbegriff für Dateinamen und HTML-IDs, einmal pro Begriff berechnet"""
+    if search_term.isascii():
+        return search_term.translate(_SAFE_NAME_TABLE)
+    # Unicode-Buchstaben bleiben wie bisher erhalten
+    return ''.join(c if c.isalnum() else '_' for c in search_term)
+
+
+@lru_cache(maxsize=65536)
+def _strip_r(name: str) -> str:
+    """Entfernt das r/-Präfix eines Subreddit-Namens, häufige Namen kommen aus dem Cache"""
+    return name[2:] if name.startswith("r/") else name
+
+
+@lru_cache(maxsize=MAX_NODE_WEIGHT + 1)
+def _node_size(search_term_count: int) -> float:
+    """Berechnet die Knotengröße aus der Anzahl der Suchtreffer, gekappt bei MAX_NODE_WEIGHT"""
+    weight = min(search_term_count, MAX_NODE_WEIGHT)
+    return MIN_NODE_SIZE + (weight / MAX_NODE_WEIGHT) * (MAX_NODE_SIZE - MIN_NODE_SIZE)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parst JSON direkt aus Bytes, bevorzugt mit orjson"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialisiert ein Objekt als UTF-8 JSON-Bytes, bevorzugt mit orjson"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+@contextmanager
+def _atomic_open(file_path: str, buffering: int = -1) -> Iterator[BinaryIO]:
+    """
+    Öffnet eine eindeutige temporäre Datei neben dem Ziel und ersetzt das Ziel
+    nach dem Schreiben per atomarem Rename. Gleichzeitige Schreiber derselben
+    Datei kommen sich so nicht in die Quere, bei Fehlern wird aufgeräumt.
+    """
+    fd, tmp_path = mkstemp(dir=path.dirname(file_path) or '.', suffix='.tmp')
+    try:
+        # mkstemp legt die Datei nur für den Besitzer lesbar an
+        fchmod(fd, 0o644)
+        with fdopen(fd, 'wb', buffering) as f:
+            yield f
+        replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_atomic(file_path: str, data: bytes) -> None:
+    """Schreibt in eine temporäre Datei und ersetzt das Ziel per atomarem Rename"""
+    with _atomic_open(file_path) as f:
+        f.write(data)
+
+
+# Platzhalter für Knoten und Kanten im gerenderten PyVis-Template
+_NODES_SENTINEL = "__PYVIS_NODES__"
+_EDGES_SENTINEL = "__PYVIS_EDGES__"
+
+
+def _payload_json(items: List[Dict[str, Any]]) -> bytes:
+    """Serialisiert Knoten oder Kanten für einen <script>-Block, "</" wird maskiert"""
+    return _json_dumps(items).replace(b"</", b"<\\/")
+
+
+def _stream_network_html(net: Network, file_path: str, body_suffix: str = "",
+                         payload: Optional[Tuple[bytes, bytes]] = None) -> None:
+    """
+    Schreibt ein PyVis-Netzwerk als HTML-Datei. Das Template wird nur mit
+    Platzhaltern gerendert, die Knoten und Kanten werden als orjson-Bytes
+    direkt dazwischen geschrieben, ohne das Dokument als String aufzubauen.
+    Die Argumente entsprechen Network.generate_html (pyvis 0.3.x); passt die
+    Template-API nicht, wird generate_html stückweise geschrieben.
+
+    Args:
+        net: Das zu schreibende Netzwerk
+        file_path: Zieldatei
+        body_suffix: HTML, das vor dem letzten </body> eingefügt wird
+        payload: Bereits serialisierte Knoten und Kanten (siehe _payload_json)
+    """
+    # Über eine temporäre Datei schreiben, damit nie eine halbe Datei sichtbar ist
+    with _atomic_open(file_path, buffering=1 << 17) as f:
+        _write_network_html(f, net, body_suffix, payload)
+
+
+def _write_network_html(f: BinaryIO, net: Network, body_suffix: str,
+                        payload: Optional[Tuple[bytes, bytes]]) -> None:
+    """Schreibt das HTML von _stream_network_html in eine geöffnete Datei"""
+    try:
+        template = net.templateEnv.get_template(net.path)
+        heading, height, width, options = net.get_network_data()[2:]
+        physics = net.options.get('physics', {}) if isinstance(net.options, dict) else None
+        rendered = template.render(
+            height=height,
+            width=width,
+            nodes=_NODES_SENTINEL,
+            edges=_EDGES_SENTINEL,
+            heading=heading,
+            options=options,
+            physics_enabled=physics.get('enabled', True) if physics is not None else net.options.physics.enabled,
+            use_DOT=net.use_DOT,
+            dot_lang=net.dot_lang,
+            widget=net.widget,
+            bgcolor=net.bgcolor,
+            conf=net.conf,
+            tooltip_link=any('href' in (node.get('title') or '') for node in net.nodes),
+            neighborhood_highlight=net.neighborhood_highlight,
+            select_menu=net.select_menu,
+            filter_menu=net.filter_menu,
+            notebook=False,
+            cdn_resources=net.cdn_resources
+        )
+        head, found_nodes, rest = rendered.partition(f'"{_NODES_SENTINEL}"')
+        middle, found_edges, tail = rest.partition(f'"{_EDGES_SENTINEL}"')
+        if not found_nodes or not found_edges:
+            raise TypeError("template does not embed nodes and edges via tojson")
+    except (AttributeError, TypeError) as e:
+        logger.debug("Template render unavailable, using generate_html: %s", e)
+        head, middle = net.generate_html(), ""
+        tail = ""
+        if body_suffix:
+            before, sep, after = head.rpartition('</body>')
+            if sep:
+                head, tail = before, body_suffix + sep + after
+        for i in range(0, len(head), 1 << 20):
+            f.write(head[i:i + (1 << 20)].encode('utf-8'))
+        f.write(tail.encode('utf-8'))
+        return
+
+    if body_suffix:
+        # Vor dem letzten </body> einfügen, das Ende des Templates ist kurz
+        before, sep, after = tail.rpartition('</body>')
+        if sep:
+            tail = before + body_suffix + sep + after
+
+    nodes_json, edges_json = payload if payload is not None else (
+        _payload_json(net.nodes), _payload_json(net.edges)
+    )
+    f.write(head.encode('utf-8'))
+    f.write(nodes_json)
+    f.write(middle.encode('utf-8'))
+    f.write(edges_json)
+    f.write(tail.encode('utf-8'))
+
+
+def _redis_socket_path() -> Optional[str]:
+    """Liefert den Unix-Socket aus REDIS_SOCK, sofern dieser existiert"""
+    socket_path = getenv('REDIS_SOCK')
+    if socket_path and path.exists(socket_path):
+        return socket_path
+    return None
+
+
+def _decode_queue_item(raw_data: bytes) -> Any:
+    """
+    Dekodiert einen Eintrag der Redis-Queue. Das erste Byte gibt das Format an,
+    damit sich Crawler und Visualizer unabhängig voneinander aktualisieren lassen.
+
+    Returns:
+        Any: Die dekodierten Daten oder None bei unbekanntem Format
+    """
+    if raw_data[:1] == QUEUE_FORMAT_JSON:
+        return _json_loads(raw_data[1:])
+    return None
+
 
 class GraphHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     """HTTP-Handler für die Visualisierung. Unterdrückt Standard-Logging."""
@@ -34,16 +440,135 @@ class GraphHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
 # Benutzerdefinierter ThreadingTCPServer, um mehrere Anfragen gleichzeitig zu verarbeiten
 class ThreadingTCPServer(socketserver.ThreadingTCPServer):
     allow_reuse_address = True
+    daemon_threads = True  # Offene Keep-Alive-Verbindungen blockieren das Beenden nicht
+    request_queue_size = 128  # Der Browser öffnet beim Laden mehrere Verbindungen gleichzeitig
 
 
 # Kombinierter Handler für statische Dateien und Export-Anfragen
 class ExportStaticHandler(http.server.SimpleHTTPRequestHandler):
     """Kombinierter Handler für statische Dateien und Export-Anfragen"""
 
+    # Alle Antworten tragen eine Content-Length, Verbindungen bleiben offen
+    protocol_version = "HTTP/1.1"
+    # Header und kleine Antworten sofort senden statt auf Nagle zu warten
+    disable_nagle_algorithm = True
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self.directory = kwargs.get('directory', 'web')
+        self._etag: Optional[str] = None  # ETag der aktuell ausgelieferten Datei
         super().__init__(*args, **kwargs)
 
+    def end_headers(self) -> None:
+        """Ergänzt ETag und Revalidierung für ausgelieferte Dateien"""
+        if self._etag is not None:
+            self.send_header("ETag", self._etag)
+            self.send_header("Cache-Control", "no-cache")
+            self._etag = None
+        super().end_headers()
+
+    def copyfile(self, source: BinaryIO, outputfile: BinaryIO) -> None:
+        """
+        Sendet Dateien per sendfile(2) direkt aus dem Kernel an den Socket,
+        ohne den Inhalt durch einen Python-Puffer zu kopieren. socket.sendfile
+        fällt selbst auf send() zurück, wo sendfile nicht verfügbar ist.
+        """
+        try:
+            source.fileno()
+        except (AttributeError, OSError):
+            super().copyfile(source, outputfile)
+            return
+        # Die Header wurden bereits ungepuffert geschrieben
+        self.connection.sendfile(source)
+
+    def _not_modified(self, etag: str) -> bool:
+        """
+        Beantwortet die Anfrage mit 304, wenn der Client die Datei in dieser
+        Version bereits besitzt.
+
+        Args:
+            etag: ETag der Datei, die ausgeliefert werden würde
+
+        Returns:
+            bool: True, wenn 304 gesendet wurde
+        """
+        if_none_match = self.headers.get('If-None-Match')
+        if not if_none_match:
+            return False
+        if if_none_match.strip() != '*' and etag not in (tag.strip() for tag in if_none_match.split(',')):
+            return False
+
+        self._etag = etag
+        self.send_response(304)
+        self.end_headers()
+        return True
+
+    def _send_json(self, status: int, response: Dict[str, Any]) -> None:
+        """
+        Sendet eine JSON-Antwort mit Content-Length, damit die Verbindung
+        per Keep-Alive weiterverwendet werden kann.
+
+        Args:
+            status: HTTP-Statuscode
+            response: Zu sendende Daten
+        """
+        body = _json_dumps(response)
+        self.send_response(status)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_head(self) -> Optional[BinaryIO]:
+        """
+        Liefert eine vorkomprimierte .gz-Variante aus, wenn der Client gzip
+        akzeptiert und die Variante mindestens so neu ist wie die Originaldatei.
+        Dateien tragen ein ETag aus mtime und Größe; kennt der Client die
+        Version bereits, wird nur 304 ohne Inhalt gesendet.
+        """
+        file_path = self.translate_path(self.path)
+        try:
+            file_stat = stat(file_path)
+        except OSError:
+            file_stat = None
+
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            try:
+                gz_file = open(f"{file_path}.gz", 'rb')
+            except OSError:
+                gz_file = None
+
+            if gz_file is not None:
+                try:
+                    gz_stat = fstat(gz_file.fileno())
+                    fresh = file_stat is not None and gz_stat.st_mtime_ns >= file_stat.st_mtime_ns
+                except OSError:
+                    fresh = False
+
+                if fresh:
+                    etag = f'"{gz_stat.st_mtime_ns:x}-{gz_stat.st_size:x}-gz"'
+                    if self._not_modified(etag):
+                        gz_file.close()
+                        return None
+
+                    self._etag = etag
+                    self.send_response(200)
+                    self.send_header("Content-Type", self.guess_type(file_path))
+                    self.send_header("Content-Encoding", "gzip")
+                    self.send_header("Content-Length", str(gz_stat.st_size))
+                    self.send_header("Last-Modified", self.date_time_string(gz_stat.st_mtime))
+                    self.send_header("Vary", "Accept-Encoding")
+                    self.end_headers()
+                    return gz_file
+                gz_file.close()
+
+        if file_stat is not None and not S_ISDIR(file_stat.st_mode):
+            etag = f'"{file_stat.st_mtime_ns:x}-{file_stat.st_size:x}"'
+            if self._not_modified(etag):
+                return None
+            self._etag = etag
+
+        return super().send_head()
+
     def do_POST(self) -> None:
         """Verarbeitet POST-Anfragen für Export und Merge-Operationen"""
         if self.path == '/export':
@@ -51,11 +576,20 @@ class ExportStaticHandler(http.server.SimpleHTTPRequestHandler):
             post_data = self.rfile.read(content_length)
 
             try:
-                data = json.loads(post_data.decode('utf-8'))
+                data = _json_loads(post_data)
 
                 # Zugriff auf Visualizer-Instanz
                 visualizer = self.server.visualizer
 
+                # Mehrere Gruppen werden parallel exportiert
+                if 'groups' in data:
+                    files = visualizer.export_clusters_as_image_batch(data['groups'])
+                    self._send_json(200, {
+                        'success': any(files),
+                        'files': files
+                    })
+                    return
+
                 # Export durchführen
                 file_path = visualizer.export_clusters_as_image(
                     data['clusters'],
@@ -63,11 +597,6 @@ class ExportStaticHandler(http.server.SimpleHTTPRequestHandler):
                     data['layout']
                 )
 
-                # Antwort senden
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-
                 if file_path:
                     response = {
                         'success': True,
@@ -79,30 +608,23 @@ class ExportStaticHandler(http.server.SimpleHTTPRequestHandler):
                         'error': 'Export fehlgeschlagen'
                     }
 
-                self.wfile.write(json.dumps(response).encode('utf-8'))
+                # Antwort senden
+                self._send_json(200, response)
             except Exception as e:
-                logger.error(f"Fehler bei Export-Anfrage: {e}", exc_info=True)
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                response = {
+                logger.error("Fehler bei Export-Anfrage: %s", e, exc_info=True)
+                self._send_json(500, {
                     'success': False,
                     'error': str(e)
-                }
-                self.wfile.write(json.dumps(response).encode('utf-8'))
+                })
         elif self.path == '/merge':
             content_length = int(self.headers['Content-Length'])
             post_data = self.rfile.read(content_length)
 
             try:
-                data = json.loads(post_data.decode('utf-8'))
+                data = _json_loads(post_data)
                 visualizer = self.server.visualizer
                 merged_file = visualizer.merge_selected_clusters(data['clusters'])
 
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-
                 if merged_file:
                     # Extrahiere die Knotenanzahl aus dem Dateinamen
                     node_count = 0
@@ -123,17 +645,13 @@ class ExportStaticHandler(http.server.SimpleHTTPRequestHandler):
                         'error': 'Merging failed'
                     }
 
-                self.wfile.write(json.dumps(response).encode('utf-8'))
+                self._send_json(200, response)
             except Exception as e:
-                logger.error(f"Error in merge request: {e}", exc_info=True)
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                response = {
+                logger.error("Error in merge request: %s", e, exc_info=True)
+                self._send_json(500, {
                     'success': False,
                     'error': str(e)
-                }
-                self.wfile.write(json.dumps(response).encode('utf-8'))
+                })
         else:
             super().do_GET()
 
@@ -142,38 +660,428 @@ class ExportStaticHandler(http.server.SimpleHTTPRequestHandler):
         pass
 
 
-class RedditGraphVisualizer:
-    """
-    Visualisiert Reddit-Netzwerkdaten mithilfe von PyVis und stellt
-    diese über einen eingebetteten Webserver dar.
-    """
-
-    def __init__(self, use_server: bool = False, batch_size: int = 30) -> None:
-        """
-        Initialisiert den Visualisierer:
-         - Verbindet zu Redis (falls gewünscht).
-         - Startet einen lokalen HTTP-Server.
-         - Konfiguriert das PyVis-Netzwerk.
-         - Initialisiert interne Datenstrukturen.
+# Statische Teile der Interface-Seite, einmalig beim Import als UTF-8 kodiert.
+# Updates setzen nur noch die Cluster-Daten an der Stelle von /*CLUSTERS*/ ein.
+INTERFACE_HTML_PREFIX, INTERFACE_HTML_SUFFIX = (
+    part.encode('utf-8') for part in """
+            <!DOCTYPE html>
+            <html>
+            <head>
+            <meta charset="UTF-8"> 
+            <title>Reddit Graph Visualization</title>
+            <style>
+            body {
+                font-family: Arial, sans-serif;
+                background-color: #222;
+                color: #fff;
+                margin: 0;
+                padding: 0;
+            }
+            .container {
+                display: flex;
+                height: 100vh;
+            }
+            .sidebar {
+                width: 250px;
+                background-color: #333;
+                padding: 20px;
+                overflow-y: auto;
+            }
+            .main-content {
+                flex-grow: 1;
+                position: relative;
+            }
+            iframe {
+                width: 100%;
+                height: 100%;
+                border: none;
+            }
+            h1, h2 {
+                margin-top: 0;
+            }
+            .cluster-list {
+                max-height: 50vh;
+                overflow-y: auto;
+            }
+            .cluster-item {
+                padding: 8px;
+                margin: 4px 0;
+                background-color: #444;
+                border-radius: 4px;
+                cursor: pointer;
+            }
+            .cluster-item:hover {
+                background-color: #555;
+            }
+            .cluster-item.active {
+                background-color: #0066cc;
+            }
+            .cluster-info {
+                font-size: 0.8em;
+                color: #aaa;
+            }
+            .filters {
+                margin: 15px 0;
+            }
+            .export-controls {
+                margin: 15px 0;
+                padding-top: 15px;
+                border-top: 1px solid #555;
+            }
+            .export-options {
+                margin: 10px 0;
+            }
+            button {
+                background-color: #0066cc;
+                color: white;
+                border: none;
+                padding: 8px 12px;
+                border-radius: 4px;
+                cursor: pointer;
+                margin: 5px 0;
+            }
+            button:hover {
+                background-color: #0055aa;
+            }
+            button:disabled {
+                background-color: #555;
+                cursor: not-allowed;
+            }
+            select, .search-box {
+                width: 90%;
+                padding: 8px;
+                margin: 10px 0;
+                background-color: #444;
+                border: none;
+                color: white;
+                border-radius: 4px;
+            }
+            #exportStatus {
+                margin-top: 10px;
+                padding: 8px;
+                background-color: #444;
+                border-radius: 4px;
+                min-height: 20px;
+            }
+            #exportStatus a {
+                color: #0099ff;
+                text-decoration: none;
+            }
+            #exportStatus a:hover {
+                text-decoration: underline;
+            }
+            .loading {
+                display: inline-block;
+                width: 20px;
+                height: 20px;
+                border: 3px solid rgba(255,255,255,.3);
+                border-radius: 50%;
+                border-top-color: #fff;
+                animation: spin 1s ease-in-out infinite;
+            }
+            @keyframes spin {
+                to { transform: rotate(360deg); }
+            }
+            </style>
+            </head>
+            <body>
+            <div class="container">
+            <div class="sidebar">
+                <h1>Reddit Graph</h1>
+                <div class="filters">
+                    <input type="text" id="searchBox" class="search-box" placeholder="Search clusters...">
+                    <button id="btnSelectAll">Select All</button>
+                    <button id="btnDeselectAll">Deselect All</button>
+                    <button id="btnShowSelected">Show Selected</button>
+                    <div>
+                        <label>Max clusters: </label>
+                        <select id="maxClusters">
+                            <option value="5">5</option>
+                            <option value="10">10</option>
+                            <option value="20" selected>20</option>
+                            <option value="50">50</option>
+                            <option value="100">100</option>
+                            <option value="0">All</option>
+                        </select>
+                    </div>
+                </div>
 
-        Args:
-            use_server: Ob eine Verbindung zu Redis hergestellt werden soll
-            batch_size: Anzahl der Datensätze, die pro Batch verarbeitet werden
-        """
-        self.use_server: bool = use_server
-        self.queue_name: str = "reddit_graph_queue"
+                <div class="export-controls">
+                    <h2>Export</h2>
+                    <div class="export-options">
+                        <select id="exportResolution">
+                            <option value="fullhd">Full HD (1920x1080)</option>
+                            <option value="4k">4K (3840x2160)</option>
+                            <option value="8k">8K (7680x4320)</option>
+                            <option value="16k">16K (15360x8640)</option>
+                        </select>
+                        <select id="exportLayout">
+                            <option value="standard">Standard</option>
+                            <option value="labels">Mit großen Labels</option>
+                        </select>
+                        <button id="btnExport">Exportieren</button>
+                    </div>
+                    <div id="exportStatus"></div>
+                </div>
 
-        # Verbindung zu Redis herstellen
-        self.redis_client: Optional[Redis] = None
-        if self.use_server:
-            self.setup_redis_connection()
-        else:
-            logger.info("Server connection not enabled. Running in JSON-only mode.")
+                <h2>Clusters</h2>
+                <div id="clusterList" class="cluster-list">
+                    <!-- Clusters will be inserted here -->
+                </div>
+            </div>
+            <div class="main-content">
+                <iframe id="graphFrame" src="placeholder.html"></iframe>
+            </div>
+            </div>
+            <script>
+            // JavaScript for interface interactions
+            const clusters = {};
+            let activeFrame = 'placeholder.html';
+            let isExporting = false;
 
-        # Konfiguration für den Webserver
-        self.port: int = 8000  # Standard-Port
+            function updateClusterDisplay() {
+                const searchTerm = document.getElementById('searchBox').value.toLowerCase();
+                const clusterList = document.getElementById('clusterList');
+                const maxClusters = parseInt(document.getElementById('maxClusters').value);
+
+                let visibleCount = 0;
+
+                Object.keys(clusters).sort().forEach(name => {
+                    const div = document.getElementById(`cluster-${name}`);
+                    if (!div) return;
+
+                    const matchesSearch = name.toLowerCase().includes(searchTerm);
+                    const withinLimit = maxClusters === 0 || visibleCount < maxClusters;
+
+                    if (matchesSearch && withinLimit) {
+                        div.style.display = 'block';
+                        visibleCount++;
+                    } else {
+                        div.style.display = 'none';
+                    }
+                });
+            }
+
+            async function showSelectedClusters() {
+                const selected = Object.keys(clusters).filter(name => 
+                    clusters[name].selected);
+
+                if (selected.length === 0) {
+                    alert('Please select at least one cluster');
+                    return;
+                }
+
+                if (selected.length === 1) {
+                    // Show single cluster
+                    setActiveFrame(`clusters/cluster_${selected[0]}.html`);
+                    document.getElementById('exportStatus').innerHTML = 
+                        `Showing single cluster: ${clusters[selected[0]].name} (${clusters[selected[0]].nodeCount} nodes)`;
+                } else {
+                    // Show merged view
+                    document.getElementById('exportStatus').innerHTML = '<div class="loading"></div> Merging clusters...';
+
+                    try {
+                        const response = await fetch('/merge', {
+                            method: 'POST',
+                            headers: {
+                                'Content-Type': 'application/json'
+                            },
+                            body: JSON.stringify({
+                                clusters: selected
+                            })
+                        });
+
+                        if (!response.ok) {
+                            throw new Error(`Merging failed: ${response.statusText}`);
+                        }
+
+                        const result = await response.json();
+
+                        if (result.success) {
+                            setActiveFrame(result.file);
+                            // Zeige die Anzahl der Knoten im zusammengeführten Graph an
+                            document.getElementById('exportStatus').innerHTML = 
+                                `Combined view with ${result.nodeCount || 'multiple'} nodes`;
+                        } else {
+                            document.getElementById('exportStatus').innerHTML = 
+                                `Error: ${result.error}`;
+                        }
+                    } catch (error) {
+                        document.getElementById('exportStatus').innerHTML = 
+                            `Error: ${error.message}`;
+                    }
+                }
+            }
+
+            function setActiveFrame(src) {
+                document.getElementById('graphFrame').src = src;
+                activeFrame = src;
+            }
+
+            async function exportSelectedClusters() {
+                const selected = Object.keys(clusters).filter(name => clusters[name].selected);
+                if (selected.length === 0) {
+                        alert('Bitte wählen Sie mindestens einen Cluster aus');
+                        return;
+                    }
+
+                    if (isExporting) {
+                        alert('Export läuft bereits, bitte warten...');
+                        return;
+                    }
+
+                    const resolution = document.getElementById('exportResolution').value;
+                    const layout = document.getElementById('exportLayout').value;
+
+                    // Warning for high-res exports with labels
+                    if ((resolution === '8k' || resolution === '16k') && 
+                        layout === 'labels' && 
+                        !confirm('Hohe Auflösung mit Labels kann längere Zeit in Anspruch nehmen. Fortfahren?')) {
+                        return;
+                    }
+
+                    const btnExport = document.getElementById('btnExport');
+                    btnExport.disabled = true;
+                    isExporting = true;
+
+                    document.getElementById('exportStatus').innerHTML = '<div class="loading"></div> Export wird vorbereitet...';
+
+                try {
+                    const response = await fetch('/export', {
+                        method: 'POST',
+                        headers: {
+                            'Content-Type': 'application/json'
+                        },
+                        body: JSON.stringify({
+                            clusters: selected,
+                            resolution: resolution,
+                            layout: layout
+                        })
+                    });
+
+                    if (!response.ok) {
+                        throw new Error(`Export fehlgeschlagen: ${response.statusText}`);
+                    }
+
+                    const result = await response.json();
+
+                    if (result.success) {
+                       document.getElementById('exportStatus').innerHTML = 
+                           `<a href="${result.file}" download>Exportierte Datei herunterladen</a>`;
+                   } else {
+                       document.getElementById('exportStatus').innerHTML = 
+                           `Fehler beim Export: ${result.error}`;
+                   }
+               } catch (error) {
+                   document.getElementById('exportStatus').innerHTML = 
+                       `Fehler: ${error.message}`;
+               } finally {
+                   btnExport.disabled = false;
+                   isExporting = false;
+               }
+            }
+
+            document.getElementById('btnSelectAll').addEventListener('click', () => {
+               Object.keys(clusters).forEach(name => {
+                   clusters[name].selected = true;
+                   const element = document.getElementById(`cluster-${name}`);
+                   if (element) element.classList.add('active');
+               });
+            });
+
+            document.getElementById('btnDeselectAll').addEventListener('click', () => {
+               Object.keys(clusters).forEach(name => {
+                   clusters[name].selected = false;
+                   const element = document.getElementById(`cluster-${name}`);
+                   if (element) element.classList.remove('active');
+               });
+            });
+
+            document.getElementById('btnShowSelected').addEventListener('click', showSelectedClusters);
+            document.getElementById('btnExport').addEventListener('click', exportSelectedClusters);
+
+            document.getElementById('searchBox').addEventListener('input', updateClusterDisplay);
+            document.getElementById('maxClusters').addEventListener('change', updateClusterDisplay);
+
+            // Die Cluster-Daten werden von Python an dieser Stelle eingefügt
+            /*CLUSTERS*/
+            </script>
+            </body>
+            </html>
+           """.split("/*CLUSTERS*/", 1)
+)
+
+# Platzhalter für den Graph-Frame, solange kein Cluster ausgewählt ist
+PLACEHOLDER_HTML = """
+           <!DOCTYPE html>
+           <html>
+           <head>
+               <style>
+                   body {
+                   font-family: Arial, sans-serif;
+                   background-color: #222;
+                   color: #fff;
+                   display: flex;
+                   justify-content: center;
+                   align-items: center;
+                   height: 100vh;
+                   margin: 0;
+               }
+               .message {
+                   text-align: center;
+                   max-width: 600px;
+                   padding: 20px;
+                   }
+               </style>
+           </head>
+           <body>
+               <div class="message">
+               <h1>Reddit Graph Visualization</h1>
+               <p>Select one or more clusters from the sidebar to visualize the data.</p>
+               </div>
+           </body>
+           </html>
+           """.encode('utf-8')
+
+
+class RedditGraphVisualizer:
+    """
+    Visualisiert Reddit-Netzwerkdaten mithilfe von PyVis und stellt
+    diese über einen eingebetteten Webserver dar.
+    """
+
+    def __init__(self, use_server: bool = False, batch_size: int = 30, render_backend: str = "pyvis") -> None:
+        """
+        Initialisiert den Visualisierer:
+         - Verbindet zu Redis (falls gewünscht).
+         - Startet einen lokalen HTTP-Server.
+         - Konfiguriert das PyVis-Netzwerk.
+         - Initialisiert interne Datenstrukturen.
+
+        Args:
+            use_server: Ob eine Verbindung zu Redis hergestellt werden soll
+            batch_size: Anzahl der Datensätze, die pro Batch verarbeitet werden
+            render_backend: "pyvis" (vis.js) oder "sigma" (WebGL) für kombinierte Ansichten
+        """
+        self.use_server: bool = use_server
+        self.render_backend: str = render_backend
+        self.queue_name: str = "reddit_graph_queue"
+        self._use_lmpop: bool = True  # Wird deaktiviert, falls der Server LMPOP nicht kennt
+        self._update_failed: bool = False  # Letzter Abruf aus Redis ist fehlgeschlagen
+
+        # Verbindung zu Redis herstellen
+        self.redis_client: Optional[Redis] = None
+        self._redis_pool: Optional[ConnectionPool] = None
+        if self.use_server:
+            self.setup_redis_connection()
+        else:
+            logger.info("Server connection not enabled. Running in JSON-only mode.")
+
+        # Konfiguration für den Webserver
+        self.port: int = 8000  # Standard-Port
         self.web_dir: str = "web"
         self.html_filename: str = "graph.html"  # Datei im Web-Verzeichnis
+        self._file_hashes: Dict[str, bytes] = {}  # Hash des zuletzt geschriebenen Inhalts je Datei
 
         # Erstelle das PyVis-Netzwerk (hauptsächlich für Legacy-Support)
         self.net: Network = self.create_network_with_options()
@@ -182,15 +1090,36 @@ class RedditGraphVisualizer:
         self.added_nodes: Set[str] = set()
         self.added_edges: Set[Tuple[str, str]] = set()
 
+        # Subreddit-Namen werden auf fortlaufende IDs abgebildet, damit Cluster-Kanten
+        # als einzelne Ganzzahl (hi << 32) | lo gespeichert werden können
+        self._id_of: Dict[str, int] = {}
+        self._names: List[str] = []
+
         # Neue Clustering-Funktionalität
         self.clusters: Dict[str, Dict[str, Any]] = {}  # Dictionary to store clusters by search term
         self.active_clusters: Set[str] = set()  # Currently displayed clusters
+        # Sanitierte Cluster-Namen -> Original, wird bei neuen Clustern verworfen
+        self._sanitized_to_original: Optional[Dict[str, str]] = None
+        # Bereits erzeugte kombinierte und Label-Ansichten je Auswahl und Datenstand
+        self._merged_views: Dict[FrozenSet[Tuple[str, int, int]], str] = {}
+        self._labeled_views: Dict[FrozenSet[Tuple[str, int, int]], str] = {}
+        self._image_views: Dict[Tuple[FrozenSet[Tuple[str, int, int]], str, str], str] = {}
+        self._views_lock = Lock()  # Schützt die drei Ansichts-Caches
+        self._view_builds: Dict[Tuple[int, Any], Lock] = {}  # Laufende Erzeugungen je Ansicht
         self.clusters_dir: str = path.join(self.web_dir, "clusters")
-        makedirs(self.clusters_dir, exist_ok=True)
+        self._dirs_made: Set[str] = set()  # Bereits angelegte Verzeichnisse
 
-        # Export-Verzeichnis erstellen
+        # Cluster-HTML wird im Hintergrund gerendert und geschrieben
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cluster_io")
+
+        # Export-Verzeichnis wird erst beim ersten Export angelegt
         self.exports_dir: str = path.join(self.web_dir, "exports")
-        makedirs(self.exports_dir, exist_ok=True)
+
+        # Chrome-Treiber werden nach einem Export für den nächsten aufbewahrt
+        self.EXPORT_WORKERS: int = max(1, (cpu_count() or 2) // 2)
+        self._driver_pool: Queue = Queue()
+        self._export_counter = count()
+        self._prune_labeled_exports()
 
         # Starte den HTTP-Server
         self.start_http_server()
@@ -200,9 +1129,15 @@ class RedditGraphVisualizer:
 
         self.last_successful_state: Optional[Dict[str, Any]] = None
 
-        self.MIN_SIZE: int = 10
-        self.MAX_SIZE: int = 100
-        self.MAX_WEIGHT: int = 1000
+        # Vollständiger Snapshot und Änderungsprotokoll des Graphen
+        self.STATE_FILE: str = "graph_state.json"
+        self.STATE_LOG_FILE: str = "graph_state.jsonl"
+        self._state_lock = Lock()  # Serialisiert Anhängen und Snapshot
+        self._state_dirty: bool = False  # Seit dem letzten Snapshot wurden Daten verarbeitet
+
+        self.MIN_SIZE: int = MIN_NODE_SIZE
+        self.MAX_SIZE: int = MAX_NODE_SIZE
+        self.MAX_WEIGHT: int = MAX_NODE_WEIGHT
 
         # Erstelle die Interface-HTML-Dateien
         self.create_interface_html()
@@ -224,76 +1159,68 @@ class RedditGraphVisualizer:
             font_color="white"  # Weiße Schrift
         )
 
-        # Standard-Konfiguration für das Netzwerk
-        options = {
-            "configure": {
-                "enabled": False
-            },
-            "physics": {
-                "enabled": True,
-                "solver": "forceAtlas2Based",  # Barnes-Hut eignet sich in der Regel besser für große Netzwerke
-                "forceAtlas2Based": {
-                    "gravitationalConstant": -50,  # Niedrigere negative Kraft für sanftere Abstoßung
-                    "centralGravity": 0.01, # Sehr schwache Zentralanziehung, damit Cluster nicht zu stark zusammenfallen
-                    "springLength": 150,  # Etwas längere Federn für mehr Abstand zwischen den Nodes
-                    "springConstant": 0.08,  # Etwas höhere Federkonstante für stabilere Verbindungen
-                    "damping": 0.4,  # Erhöhtes Dämpfungsverhalten, um das Oszillieren zu reduzieren
-                    "avoidOverlap": 4  # Leicht erhöhen, um Überschneidungen zu minimieren
-                },
-                "stabilization": {
-                    "enabled": True,
-                    "iterations": 1000,
-                    "updateInterval": 100
-                },
-                "minVelocity": 0.1,
-                "maxVelocity": 50
-            },
-            "nodes": {
-                "scaling": {
-                    "min": 10,
-                    "max": 100
-                },
-                "shadow": {
-                    "enabled": True,
-                    "size": 15
-                },
-                "font": {
-                    "size": 12,
-                    "face": "Arial"
-                }
-            },
-            "edges": {
-                "smooth": {
-                    "enabled": False,
-                    "type": "dynamic"  # Dynamische Kanten können den Fluss des Netzwerks besser betonen
-                },
-                "color": {
-                    "inherit": "from"  # Kantenfarbe von den verbundenen Knoten erben
-                },
-                "width": 1.5
-            },
-            "interaction": {
-                "hideEdgesOnDrag": True,
-                "tooltipDelay": 100
-            }
-        }
-
         # Setze die Optionen für das Netzwerk
-        net.set_options(dumps(options))
+        net.set_options(NETWORK_OPTIONS_JSON)
         return net
 
     def save_state(self) -> None:
-        """Speichert den aktuellen Zustand des Graphen in einer JSON-Datei."""
+        """
+        Hängt die seit dem letzten Aufruf hinzugekommenen Knoten und Kanten je
+        Cluster als JSON-Zeile an graph_state.jsonl an. Die Einträge sind
+        additiv, der vollständige Stand entsteht aus graph_state.json und
+        allen danach angehängten Zeilen.
+        """
+        lines = []
+        for search_term, cluster in list(self.clusters.items()):
+            with cluster['lock']:
+                line = self._take_state_line(search_term, cluster)
+            if line is not None:
+                lines.append(line)
+        self._append_state_lines(lines)
+
+    def _take_state_line(self, search_term: str, cluster: Dict[str, Any]) -> Optional[bytes]:
+        """
+        Entnimmt die neuen Knoten und Kanten eines Clusters als JSON-Zeile.
+        Muss unter der Sperre des Clusters aufgerufen werden.
+        """
+        if not cluster['new_nodes'] and not cluster['new_edges']:
+            return None
+        line = _json_dumps({
+            'cluster': search_term,
+            'nodes': cluster['new_nodes'],
+            'edges': [self._edge_names(edge) for edge in cluster['new_edges']]
+        })
+        cluster['new_nodes'] = []
+        cluster['new_edges'] = []
+        return line
+
+    def _append_state_lines(self, lines: List[bytes]) -> None:
+        """Hängt JSON-Zeilen an das Änderungsprotokoll an"""
+        if not lines:
+            return
+        with self._state_lock:
+            with open(self.STATE_LOG_FILE, 'ab') as f:
+                f.write(b"\n".join(lines) + b"\n")
+        logger.info("Graph state: %s cluster changes appended", len(lines))
+
+    def checkpoint_state(self) -> None:
+        """
+        Schreibt den vollständigen Zustand des Graphen nach graph_state.json
+        und leert danach das Änderungsprotokoll.
+        """
         # Erstelle eine vereinfachte Version der Cluster für die Speicherung
         serializable_clusters = {}
         for search_term, cluster in self.clusters.items():
-            serializable_clusters[search_term] = {
-                'nodes': list(cluster['nodes']),
-                'edges': list(cluster['edges']),
-                'node_count': cluster['node_count'],
-                'edge_count': cluster['edge_count']
-                # Das Network-Objekt wird ausgelassen
-            }
+            with cluster['lock']:
+                serializable_clusters[search_term] = {
+                    'nodes': list(cluster['nodes']),
+                    'edges': [self._edge_names(edge) for edge in cluster['edges']],
+                    'node_count': cluster['node_count'],
+                    'edge_count': cluster['edge_count']
+                    # Das Network-Objekt wird ausgelassen
+                }
+                cluster['new_nodes'] = []
+                cluster['new_edges'] = []
 
         state = {
             'nodes': list(self.added_nodes),
@@ -301,10 +1228,19 @@ class RedditGraphVisualizer:
             'clusters': serializable_clusters
         }
 
-        with open('graph_state.json', 'w') as f:
-            dump(state, f)
+        with self._state_lock:
+            _write_atomic(self.STATE_FILE, _json_dumps(state))
+            # Erst nach dem Snapshot sind die protokollierten Änderungen überflüssig
+            open(self.STATE_LOG_FILE, 'wb').close()
+        self._state_dirty = False
         logger.info("Graph state saved successfully")
 
+    def _ensure_dir(self, dir_path: str) -> None:
+        """Legt ein Verzeichnis (samt Elternverzeichnissen) höchstens einmal pro Lauf an"""
+        if dir_path not in self._dirs_made:
+            makedirs(dir_path, exist_ok=True)
+            self._dirs_made.add(dir_path)
+
     def start_http_server(self) -> None:
         """
         Startet einen HTTP-Server in einem separaten Thread.
@@ -312,41 +1248,32 @@ class RedditGraphVisualizer:
         verarbeitet Export-Anfragen.
         """
         try:
-            # Überprüfen, ob der Port verfügbar ist
-            import socket
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            result = sock.connect_ex(('localhost', self.port))
-            if result == 0:
-                logger.warning(f"Port {self.port} is already in use. Trying alternative port.")
-                # Finde einen freien Port
-                sock.close()
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.bind(('localhost', 0))
-                self.port = sock.getsockname()[1]
-                logger.info(f"Using alternative port: {self.port}")
-            sock.close()
-
-            makedirs(self.web_dir, exist_ok=True)
-            makedirs(self.clusters_dir, exist_ok=True)
-            makedirs(self.exports_dir, exist_ok=True)
+            self._ensure_dir(self.clusters_dir)
 
             # Erstelle eine leere graph.html im web-Verzeichnis
             file_path = path.join(self.web_dir, self.html_filename)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write("<html><body>Loading...</body></html>")
+            self._write_if_changed(file_path, "<html><body>Loading...</body></html>")
 
             # Kombinierter Handler für statische Dateien und Export-Anfragen
             handler = partial(ExportStaticHandler, directory=self.web_dir)
 
-            self.httpd = ThreadingTCPServer(("", self.port), handler)
+            # Direkt binden, ist der Port belegt, vergibt das System einen freien
+            try:
+                self.httpd = ThreadingTCPServer(("", self.port), handler)
+            except OSError:
+                logger.warning("Port %s is already in use. Trying alternative port.", self.port)
+                self.httpd = ThreadingTCPServer(("", 0), handler)
+                self.port = self.httpd.server_address[1]
+                logger.info("Using alternative port: %s", self.port)
             self.httpd.visualizer = self  # Zugriff auf Visualizer-Instanz
 
-            server_thread = Thread(target=self.httpd.serve_forever, daemon=True)
+            # Kurzes Poll-Intervall, damit shutdown() beim Beenden sofort zurückkehrt
+            server_thread = Thread(target=partial(self.httpd.serve_forever, poll_interval=0.1), daemon=True)
             server_thread.start()
 
-            logger.info(f"Graph visualization server started at http://localhost:{self.port}")
+            logger.info("Graph visualization server started at http://localhost:%s", self.port)
         except Exception as e:
-            logger.error(f"Failed to start HTTP server: {e}", exc_info=True)
+            logger.error("Failed to start HTTP server: %s", e, exc_info=True)
             raise SystemExit(1)
 
     def setup_redis_connection(self) -> None:
@@ -354,74 +1281,155 @@ class RedditGraphVisualizer:
         max_retries = 5
         retry_delay = 5  # Sekunden
 
+        # Ein gemeinsamer Pool für alle Threads; Verbindungen bleiben offen und
+        # werden wiederverwendet. Das Socket-Timeout liegt über dem BLPOP-Timeout
+        pool_kwargs: Dict[str, Any] = dict(
+            db=0,
+            max_connections=8,
+            socket_timeout=5,
+            socket_connect_timeout=5,
+            health_check_interval=30
+        )
+        socket_path = _redis_socket_path()
+        if socket_path:
+            # Unix-Socket bevorzugen, falls vorhanden, sonst TCP
+            self._redis_pool = ConnectionPool(
+                connection_class=UnixDomainSocketConnection, path=socket_path, **pool_kwargs
+            )
+        else:
+            self._redis_pool = ConnectionPool(
+                host='localhost', port=6379, socket_keepalive=True, **pool_kwargs
+            )
+
         for attempt in range(max_retries):
             try:
-                self.redis_client = Redis(
-                    host='localhost',
-                    port=6379,
-                    db=0,
-                    socket_connect_timeout=5
-                )
+                self.redis_client = Redis(connection_pool=self._redis_pool)
                 self.redis_client.ping()
                 logger.info("Successfully connected to Redis")
                 return
             except ConnectionError:
                 if attempt < max_retries - 1:
                     logger.warning(
-                        f"Redis connection attempt {attempt + 1} failed. Retrying in {retry_delay} seconds..."
+                        "Redis connection attempt %s failed. Retrying in %s seconds...", attempt + 1, retry_delay
                     )
                     sleep(retry_delay)
                 else:
                     logger.error("Could not connect to Redis after multiple attempts")
                     break  # Bei Fehlschlag, einfach weitermachen
 
-    def update_graph(self) -> bool:
+    def update_graph(self, block: bool = False) -> bool:
         """
         Verarbeitet neue Daten aus der Redis-Queue (nur, wenn der Server genutzt wird),
         validiert diese und aktualisiert den Graphen, wenn nötig.
 
+        Args:
+            block: Bei leerer Queue bis zu einer Sekunde auf neue Daten warten
+
         Returns:
             bool: True, wenn neue Daten verarbeitet wurden, sonst False.
         """
         if not self.use_server or not self.redis_client:
             return False
 
+        self._update_failed = False
         try:
             batch_data: List[Dict[str, Any]] = []
-            updates = 0
-
-            # Sammle Batch von Daten aus Redis
-            while updates < self.batch_size:
-                raw_data = self.redis_client.lpop(self.queue_name)
-                if not raw_data:
-                    break
 
-                data = pickle.loads(raw_data)
-                if isinstance(data, dict):
+            # Sammle Batch von Daten aus Redis in einem einzigen Roundtrip
+            # Der Crawler sendet ausschließlich Objekte im Format der Speicherdatei,
+            # geprüft wird hier nur noch die Formatkennung
+            for raw_data in self._pop_batch(block):
+                data = _decode_queue_item(raw_data)
+                if data is not None:
                     batch_data.append(data)
-                    updates += 1
                 else:
-                    logger.warning(f"Skipping invalid data format: {data}")
+                    logger.warning("Skipping invalid data format: %r", raw_data[:32])
 
             if not batch_data:
                 return False
 
             # Verarbeite den gesamten Batch
+            dirty_clusters: Set[str] = set()
             for data in batch_data:
                 # Bestimme den Search Term für dieses Subreddit
                 search_term = data.get("search_term", "unknown")
 
                 # Füge es zum entsprechenden Cluster hinzu
                 self._add_to_cluster(search_term, data)
+                dirty_clusters.add(search_term)
+
+            # Jeder geänderte Cluster wird pro Batch nur einmal gespeichert,
+            # seine Änderungen werden dabei an das Zustandsprotokoll angehängt
+            self._save_clusters(dirty_clusters)
+            self._state_dirty = True
 
             # Update die Interface-HTML
             self.update_interface_html()
 
             return True
         except Exception as e:
-            logger.error(f"Error processing Redis data: {e}", exc_info=True)
+            logger.error("Error processing Redis data: %s", e, exc_info=True)
+            self._update_failed = True
             return False
 
+    def _pop_batch(self, block: bool = False) -> List[bytes]:
+        """
+        Entnimmt bis zu batch_size Einträge vom Anfang der Queue. Nutzt LMPOP
+        (ab Redis 7) und fällt sonst auf LRANGE+LTRIM in einer Transaktion zurück.
+
+        Args:
+            block: Mit BLPOP bis zu einer Sekunde auf den ersten Eintrag warten,
+                   Redis weckt den Aufruf sofort, sobald Daten eintreffen
+
+        Returns:
+            List[bytes]: Die rohen Einträge in Queue-Reihenfolge
+        """
+        count = self.batch_size
+        first: List[bytes] = []
+        if block and (count <= 1 or not self._use_lmpop):
+            result = self.redis_client.blpop([self.queue_name], timeout=1)
+            if not result:
+                return []
+            first = [result[1]]
+            count -= 1
+            if count <= 0:
+                return first
+
+        elif block:
+            # BLPOP und LMPOP in einem Pipeline-Roundtrip: Redis führt LMPOP
+            # direkt nach dem Aufwachen von BLPOP aus
+            with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.blpop([self.queue_name], timeout=1)
+                pipe.lmpop(1, self.queue_name, direction="LEFT", count=count - 1)
+                head, rest = pipe.execute(raise_on_error=False)
+            if isinstance(head, Exception):
+                raise head
+            first = [head[1]] if head else []
+            if isinstance(rest, ResponseError):
+                # Den per BLPOP entnommenen Eintrag nicht verwerfen
+                logger.info("LMPOP not supported by Redis server, falling back to LRANGE+LTRIM")
+                self._use_lmpop = False
+                count -= len(first)
+            elif isinstance(rest, Exception):
+                raise rest
+            else:
+                return first + rest[1] if rest else first
+
+        if self._use_lmpop:
+            try:
+                result = self.redis_client.lmpop(1, self.queue_name, direction="LEFT", count=count)
+                return first + result[1] if result else first
+            except ResponseError:
+                logger.info("LMPOP not supported by Redis server, falling back to LRANGE+LTRIM")
+                self._use_lmpop = False
+
+        # MULTI/EXEC liest und entfernt die Einträge atomar in einem Roundtrip
+        with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.lrange(self.queue_name, 0, count - 1)
+            pipe.ltrim(self.queue_name, count, -1)
+            items, _ = pipe.execute()
+        return first + items
+
     def _add_to_cluster(self, search_term: str, data: Dict[str, Any]) -> None:
         """
         Fügt Daten zu einem bestimmten Cluster hinzu
@@ -437,8 +1445,16 @@ class RedditGraphVisualizer:
                 'nodes': set(),
                 'edges': set(),
                 'node_count': 0,
-                'edge_count': 0
+                'edge_count': 0,
+                'lock': Lock(),  # Schützt Netzwerk und Sets gegen gleichzeitiges Rendern
+                'save_pending': False,
+                # Seit dem letzten save_state hinzugekommene Knoten und Kanten
+                'new_nodes': [],
+                'new_edges': [],
+                # Spaltenweise Anzeige-Daten der Label-Ansicht, siehe _labeled_columns
+                'labeled': {'ids': [], 'labels': [], 'titles': [], 'colors': [], 'sizes': array('d'), 'scaled': []}
             }
+            self._sanitized_to_original = None
 
         cluster = self.clusters[search_term]
         network = cluster['network']
@@ -448,47 +1464,170 @@ class RedditGraphVisualizer:
         # Extrahiere den Subreddit-Namen
         subreddit_name = data.get("name")
         if not subreddit_name:
-            logger.warning(f"Skipping data item without name: {data}")
+            logger.warning("Skipping data item without name: %s", data)
             return
 
-        # Füge Hauptknoten hinzu
-        if subreddit_name not in added_nodes:
-            self._add_node_to_network(
-                network,
-                subreddit_name,
-                data.get("search_term_count", 1),
-                data.get("nsfw", False),
-                data.get("related_count", 0),
-                added_nodes
-            )
-            cluster['node_count'] += 1
-
-        # Verarbeite verwandte Subreddits
-        related_subreddits = data.get("related_subreddits", [])
-        for related in related_subreddits:
-            # Entferne r/ Prefix falls vorhanden
-            related_name = related.replace("r/", "") if related.startswith("r/") else related
-
-            # Füge verwandten Knoten hinzu falls noch nicht vorhanden
-            if related_name not in added_nodes:
-                network.add_node(
-                    related_name,
-                    label=related_name,
-                    size=self.MIN_SIZE,
-                    color="#ff9999"  # Hellrot für verwandte Knoten
+        with cluster['lock']:
+            # Füge Hauptknoten hinzu
+            if subreddit_name not in added_nodes:
+                self._add_node_to_network(
+                    network,
+                    subreddit_name,
+                    data.get("search_term_count", 1),
+                    data.get("nsfw", False),
+                    data.get("related_count", 0),
+                    added_nodes
                 )
-                added_nodes.add(related_name)
                 cluster['node_count'] += 1
+                cluster['new_nodes'].append(subreddit_name)
 
-            # Füge Kante hinzu falls noch nicht vorhanden
-            edge = tuple(sorted([subreddit_name, related_name]))
-            if edge not in added_edges:
-                network.add_edge(*edge, color="#ffffff")
-                added_edges.add(edge)
-                cluster['edge_count'] += 1
+            # Verarbeite verwandte Subreddits
+            related_subreddits = data.get("related_subreddits", [])
+            for related in related_subreddits:
+                # Entferne r/ Prefix falls vorhanden
+                related_name = _strip_r(related)
 
-        # Speichere den Cluster
-        self.save_cluster(search_term, network)
+                # Füge verwandten Knoten hinzu falls noch nicht vorhanden
+                if related_name not in added_nodes:
+                    network.add_node(
+                        related_name,
+                        label=related_name,
+                        size=self.MIN_SIZE,
+                        color="#ff9999"  # Hellrot für verwandte Knoten
+                    )
+                    added_nodes.add(related_name)
+                    cluster['node_count'] += 1
+                    cluster['new_nodes'].append(related_name)
+
+                # Füge Kante hinzu falls noch nicht vorhanden
+                edge = self._edge_key(subreddit_name, related_name)
+                if edge not in added_edges:
+                    network.add_edge(subreddit_name, related_name, color="#ffffff")
+                    added_edges.add(edge)
+                    cluster['edge_count'] += 1
+                    cluster['new_edges'].append(edge)
+
+    def _view_key(self, search_terms: List[str]) -> FrozenSet[Tuple[str, int, int]]:
+        """
+        Schlüssel einer Cluster-Auswahl für die zwischengespeicherten Ansichten.
+        Cluster wachsen nur, daher ändern sich ihre Knoten- und Kantenzahlen
+        genau dann, wenn neue Daten hinzugekommen sind.
+        """
+        return frozenset(
+            (search_term, self.clusters[search_term]['node_count'], self.clusters[search_term]['edge_count'])
+            for search_term in search_terms
+        )
+
+    def _cached_view(self, views: Dict[Any, str], key: Any, base_dir: str) -> Optional[str]:
+        """Liefert eine früher erzeugte Ansicht, sofern die Datei noch existiert"""
+        with self._views_lock:
+            relative_path = views.get(key)
+        if relative_path is not None and path.exists(path.join(base_dir, relative_path)):
+            return relative_path
+        return None
+
+    def _remember_view(self, views: Dict[Any, str], key: Any, relative_path: str) -> None:
+        """Merkt sich eine erzeugte Ansicht, die älteste fällt ab 64 Einträgen heraus"""
+        # Anfragen werden in eigenen Threads bearbeitet, das Verdrängen des
+        # ältesten Eintrags muss daher unter der Sperre geschehen
+        with self._views_lock:
+            views[key] = relative_path
+            if len(views) > 64:
+                del views[next(iter(views))]
+
+    def _build_view_once(self, views: Dict[Any, str], key: Any, build: Callable[[], Optional[str]]) -> Optional[str]:
+        """
+        Liefert eine zwischengespeicherte Ansicht oder erzeugt sie mit build.
+        Gleichzeitige Anfragen derselben Ansicht warten auf die erste, statt
+        dieselbe Datei parallel ein zweites Mal zu erzeugen.
+        """
+        cached = self._cached_view(views, key, self.web_dir)
+        if cached is not None:
+            logger.info("Reusing %s", cached)
+            return cached
+
+        lock_key = (id(views), key)
+        with self._views_lock:
+            build_lock = self._view_builds.setdefault(lock_key, Lock())
+        try:
+            with build_lock:
+                cached = self._cached_view(views, key, self.web_dir)
+                if cached is not None:
+                    logger.info("Reusing %s", cached)
+                    return cached
+                return build()
+        finally:
+            with self._views_lock:
+                if self._view_builds.get(lock_key) is build_lock:
+                    del self._view_builds[lock_key]
+
+    def _resolve_cluster_names(self, cluster_names: List[str]) -> List[str]:
+        """Übersetzt Original- oder sanitierte Cluster-Namen in die Suchbegriffe"""
+        sanitized_to_original = self._get_sanitized_map()
+        selected_search_terms = []
+        for name in cluster_names:
+            if name in self.clusters:
+                selected_search_terms.append(name)
+            elif name in sanitized_to_original:
+                selected_search_terms.append(sanitized_to_original[name])
+        return selected_search_terms
+
+    def _get_sanitized_map(self) -> Dict[str, str]:
+        """Liefert die Zuordnung sanitierter Cluster-Namen zu den Suchbegriffen"""
+        sanitized_to_original = self._sanitized_to_original
+        if sanitized_to_original is None:
+            sanitized_to_original = self._sanitized_to_original = {
+                _safe_name(name): name
+                for name in list(self.clusters)
+            }
+        return sanitized_to_original
+
+    def _intern(self, name: str) -> int:
+        """Liefert die ID eines Subreddit-Namens und vergibt bei Bedarf eine neue"""
+        node_id = self._id_of.get(name)
+        if node_id is None:
+            node_id = self._id_of[name] = len(self._names)
+            self._names.append(name)
+        return node_id
+
+    def _edge_key(self, a: str, b: str) -> int:
+        """Kodiert eine ungerichtete Kante als eine Ganzzahl"""
+        id_a = self._intern(a)
+        id_b = self._intern(b)
+        lo, hi = (id_a, id_b) if id_a < id_b else (id_b, id_a)
+        return (hi << 32) | lo
+
+    def _edge_names(self, edge: int) -> Tuple[str, str]:
+        """Wandelt einen Kanten-Schlüssel zurück in die beiden Subreddit-Namen"""
+        return self._names[edge & 0xFFFFFFFF], self._names[edge >> 32]
+
+    def _save_clusters(self, search_terms: Set[str]) -> None:
+        """
+        Übergibt die angegebenen Cluster zum Speichern an den I/O-Pool.
+        Ist für einen Cluster bereits ein Speichervorgang eingeplant, der noch
+        nicht begonnen hat, enthält dieser auch die neuen Änderungen.
+
+        Args:
+            search_terms: Namen der geänderten Cluster
+        """
+        for search_term in search_terms:
+            cluster = self.clusters.get(search_term)
+            if cluster is None or cluster['save_pending']:
+                continue
+            cluster['save_pending'] = True
+            self._io_pool.submit(self._save_cluster_job, search_term, cluster)
+
+    def _save_cluster_job(self, search_term: str, cluster: Dict[str, Any]) -> None:
+        """
+        Rendert und speichert einen Cluster im I/O-Pool unter dessen Lock und
+        hängt seine neuen Knoten und Kanten an das Zustandsprotokoll an
+        """
+        with cluster['lock']:
+            cluster['save_pending'] = False
+            self.save_cluster(search_term, cluster['network'])
+            line = self._take_state_line(search_term, cluster)
+        if line is not None:
+            self._append_state_lines([line])
 
     def _add_node_to_network(
             self,
@@ -513,13 +1652,9 @@ class RedditGraphVisualizer:
         if name in added_nodes:
             return
 
-        color = "#ff0000" if is_nsfw else "#00ff00"
-        weight = min(search_term_count, self.MAX_WEIGHT)
-        size = self.MIN_SIZE + (weight / self.MAX_WEIGHT) * (self.MAX_SIZE - self.MIN_SIZE)
-
-        title = (f"Related count: {related_count}\n"
-                 f"Search term count: {search_term_count}\n"
-                 f"NSFW: {is_nsfw}")
+        color = _NODE_COLOR[bool(is_nsfw)]
+        size = _node_size(search_term_count)
+        title = _node_title(related_count, search_term_count, is_nsfw)
 
         network.add_node(
             name,
@@ -539,415 +1674,59 @@ class RedditGraphVisualizer:
             network: Das zu speichernde Netzwerk
         """
         # Sanitize search term for filename
-        safe_name = ''.join(c if c.isalnum() else '_' for c in search_term)
+        safe_name = _safe_name(search_term)
         file_path = path.join(self.clusters_dir, f"cluster_{safe_name}.html")
 
         try:
-            html_content = network.generate_html()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            logger.info(f"Saved cluster for '{search_term}' with {len(network.nodes)} nodes")
+            # Einmal komplett kodieren und atomar ersetzen, damit der Browser nie eine halbe Datei lädt
+            html_bytes = network.generate_html().encode('utf-8')
+            _write_atomic(file_path, html_bytes)
+            # Vorkomprimierte Variante für Clients mit gzip-Unterstützung
+            _write_atomic(f"{file_path}.gz", gzip.compress(html_bytes, compresslevel=6))
+            logger.info("Saved cluster for '%s' with %s nodes", search_term, len(network.nodes))
         except Exception as e:
-            logger.error(f"Failed to save cluster for '{search_term}'", exc_info=True)
+            logger.error("Failed to save cluster for '%s'", search_term, exc_info=True)
 
     def create_interface_html(self) -> None:
         """Erstellt die Haupt-Interface-HTML-Datei"""
-        html = """
-            <!DOCTYPE html>
-            <html>
-            <head>
-            <meta charset="UTF-8"> 
-            <title>Reddit Graph Visualization</title>
-            <style>
-            body {
-                font-family: Arial, sans-serif;
-                background-color: #222;
-                color: #fff;
-                margin: 0;
-                padding: 0;
-            }
-            .container {
-                display: flex;
-                height: 100vh;
-            }
-            .sidebar {
-                width: 250px;
-                background-color: #333;
-                padding: 20px;
-                overflow-y: auto;
-            }
-            .main-content {
-                flex-grow: 1;
-                position: relative;
-            }
-            iframe {
-                width: 100%;
-                height: 100%;
-                border: none;
-            }
-            h1, h2 {
-                margin-top: 0;
-            }
-            .cluster-list {
-                max-height: 50vh;
-                overflow-y: auto;
-            }
-            .cluster-item {
-                padding: 8px;
-                margin: 4px 0;
-                background-color: #444;
-                border-radius: 4px;
-                cursor: pointer;
-            }
-            .cluster-item:hover {
-                background-color: #555;
-            }
-            .cluster-item.active {
-                background-color: #0066cc;
-            }
-            .cluster-info {
-                font-size: 0.8em;
-                color: #aaa;
-            }
-            .filters {
-                margin: 15px 0;
-            }
-            .export-controls {
-                margin: 15px 0;
-                padding-top: 15px;
-                border-top: 1px solid #555;
-            }
-            .export-options {
-                margin: 10px 0;
-            }
-            button {
-                background-color: #0066cc;
-                color: white;
-                border: none;
-                padding: 8px 12px;
-                border-radius: 4px;
-                cursor: pointer;
-                margin: 5px 0;
-            }
-            button:hover {
-                background-color: #0055aa;
-            }
-            button:disabled {
-                background-color: #555;
-                cursor: not-allowed;
-            }
-            select, .search-box {
-                width: 90%;
-                padding: 8px;
-                margin: 10px 0;
-                background-color: #444;
-                border: none;
-                color: white;
-                border-radius: 4px;
-            }
-            #exportStatus {
-                margin-top: 10px;
-                padding: 8px;
-                background-color: #444;
-                border-radius: 4px;
-                min-height: 20px;
-            }
-            #exportStatus a {
-                color: #0099ff;
-                text-decoration: none;
-            }
-            #exportStatus a:hover {
-                text-decoration: underline;
-            }
-            .loading {
-                display: inline-block;
-                width: 20px;
-                height: 20px;
-                border: 3px solid rgba(255,255,255,.3);
-                border-radius: 50%;
-                border-top-color: #fff;
-                animation: spin 1s ease-in-out infinite;
-            }
-            @keyframes spin {
-                to { transform: rotate(360deg); }
-            }
-            </style>
-            </head>
-            <body>
-            <div class="container">
-            <div class="sidebar">
-                <h1>Reddit Graph</h1>
-                <div class="filters">
-                    <input type="text" id="searchBox" class="search-box" placeholder="Search clusters...">
-                    <button id="btnSelectAll">Select All</button>
-                    <button id="btnDeselectAll">Deselect All</button>
-                    <button id="btnShowSelected">Show Selected</button>
-                    <div>
-                        <label>Max clusters: </label>
-                        <select id="maxClusters">
-                            <option value="5">5</option>
-                            <option value="10">10</option>
-                            <option value="20" selected>20</option>
-                            <option value="50">50</option>
-                            <option value="100">100</option>
-                            <option value="0">All</option>
-                        </select>
-                    </div>
-                </div>
-
-                <div class="export-controls">
-                    <h2>Export</h2>
-                    <div class="export-options">
-                        <select id="exportResolution">
-                            <option value="fullhd">Full HD (1920x1080)</option>
-                            <option value="4k">4K (3840x2160)</option>
-                            <option value="8k">8K (7680x4320)</option>
-                            <option value="16k">16K (15360x8640)</option>
-                        </select>
-                        <select id="exportLayout">
-                            <option value="standard">Standard</option>
-                            <option value="labels">Mit großen Labels</option>
-                        </select>
-                        <button id="btnExport">Exportieren</button>
-                    </div>
-                    <div id="exportStatus"></div>
-                </div>
-
-                <h2>Clusters</h2>
-                <div id="clusterList" class="cluster-list">
-                    <!-- Clusters will be inserted here -->
-                </div>
-            </div>
-            <div class="main-content">
-                <iframe id="graphFrame" src="placeholder.html"></iframe>
-            </div>
-            </div>
-            <script>
-            // JavaScript for interface interactions
-            const clusters = {};
-            let activeFrame = 'placeholder.html';
-            let isExporting = false;
-
-            function updateClusterDisplay() {
-                const searchTerm = document.getElementById('searchBox').value.toLowerCase();
-                const clusterList = document.getElementById('clusterList');
-                const maxClusters = parseInt(document.getElementById('maxClusters').value);
-
-                let visibleCount = 0;
-
-                Object.keys(clusters).sort().forEach(name => {
-                    const div = document.getElementById(`cluster-${name}`);
-                    if (!div) return;
-
-                    const matchesSearch = name.toLowerCase().includes(searchTerm);
-                    const withinLimit = maxClusters === 0 || visibleCount < maxClusters;
-
-                    if (matchesSearch && withinLimit) {
-                        div.style.display = 'block';
-                        visibleCount++;
-                    } else {
-                        div.style.display = 'none';
-                    }
-                });
-            }
-
-            async function showSelectedClusters() {
-                const selected = Object.keys(clusters).filter(name => 
-                    clusters[name].selected);
-
-                if (selected.length === 0) {
-                    alert('Please select at least one cluster');
-                    return;
-                }
-
-                if (selected.length === 1) {
-                    // Show single cluster
-                    setActiveFrame(`clusters/cluster_${selected[0]}.html`);
-                    document.getElementById('exportStatus').innerHTML = 
-                        `Showing single cluster: ${clusters[selected[0]].name} (${clusters[selected[0]].nodeCount} nodes)`;
-                } else {
-                    // Show merged view
-                    document.getElementById('exportStatus').innerHTML = '<div class="loading"></div> Merging clusters...';
-
-                    try {
-                        const response = await fetch('/merge', {
-                            method: 'POST',
-                            headers: {
-                                'Content-Type': 'application/json'
-                            },
-                            body: JSON.stringify({
-                                clusters: selected
-                            })
-                        });
-
-                        if (!response.ok) {
-                            throw new Error(`Merging failed: ${response.statusText}`);
-                        }
-
-                        const result = await response.json();
-
-                        if (result.success) {
-                            setActiveFrame(result.file);
-                            // Zeige die Anzahl der Knoten im zusammengeführten Graph an
-                            document.getElementById('exportStatus').innerHTML = 
-                                `Combined view with ${result.nodeCount || 'multiple'} nodes`;
-                        } else {
-                            document.getElementById('exportStatus').innerHTML = 
-                                `Error: ${result.error}`;
-                        }
-                    } catch (error) {
-                        document.getElementById('exportStatus').innerHTML = 
-                            `Error: ${error.message}`;
-                    }
-                }
-            }
-
-            function setActiveFrame(src) {
-                document.getElementById('graphFrame').src = src;
-                activeFrame = src;
-            }
-
-            async function exportSelectedClusters() {
-                const selected = Object.keys(clusters).filter(name => clusters[name].selected);
-                if (selected.length === 0) {
-                        alert('Bitte wählen Sie mindestens einen Cluster aus');
-                        return;
-                    }
-
-                    if (isExporting) {
-                        alert('Export läuft bereits, bitte warten...');
-                        return;
-                    }
-
-                    const resolution = document.getElementById('exportResolution').value;
-                    const layout = document.getElementById('exportLayout').value;
-
-                    // Warning for high-res exports with labels
-                    if ((resolution === '8k' || resolution === '16k') && 
-                        layout === 'labels' && 
-                        !confirm('Hohe Auflösung mit Labels kann längere Zeit in Anspruch nehmen. Fortfahren?')) {
-                        return;
-                    }
-
-                    const btnExport = document.getElementById('btnExport');
-                    btnExport.disabled = true;
-                    isExporting = true;
-
-                    document.getElementById('exportStatus').innerHTML = '<div class="loading"></div> Export wird vorbereitet...';
-
-                try {
-                    const response = await fetch('/export', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json'
-                        },
-                        body: JSON.stringify({
-                            clusters: selected,
-                            resolution: resolution,
-                            layout: layout
-                        })
-                    });
-
-                    if (!response.ok) {
-                        throw new Error(`Export fehlgeschlagen: ${response.statusText}`);
-                    }
-
-                    const result = await response.json();
-
-                    if (result.success) {
-                       document.getElementById('exportStatus').innerHTML = 
-                           `<a href="${result.file}" download>Exportierte Datei herunterladen</a>`;
-                   } else {
-                       document.getElementById('exportStatus').innerHTML = 
-                           `Fehler beim Export: ${result.error}`;
-                   }
-               } catch (error) {
-                   document.getElementById('exportStatus').innerHTML = 
-                       `Fehler: ${error.message}`;
-               } finally {
-                   btnExport.disabled = false;
-                   isExporting = false;
-               }
-            }
-
-            document.getElementById('btnSelectAll').addEventListener('click', () => {
-               Object.keys(clusters).forEach(name => {
-                   clusters[name].selected = true;
-                   const element = document.getElementById(`cluster-${name}`);
-                   if (element) element.classList.add('active');
-               });
-            });
-
-            document.getElementById('btnDeselectAll').addEventListener('click', () => {
-               Object.keys(clusters).forEach(name => {
-                   clusters[name].selected = false;
-                   const element = document.getElementById(`cluster-${name}`);
-                   if (element) element.classList.remove('active');
-               });
-            });
-
-            document.getElementById('btnShowSelected').addEventListener('click', showSelectedClusters);
-            document.getElementById('btnExport').addEventListener('click', exportSelectedClusters);
+        try:
+            self._write_if_changed(
+                path.join(self.web_dir, self.html_filename),
+                INTERFACE_HTML_PREFIX + INTERFACE_HTML_SUFFIX
+            )
+            self._write_if_changed(path.join(self.web_dir, "placeholder.html"), PLACEHOLDER_HTML)
+            logger.info("Created interface HTML files")
+        except Exception as e:
+            logger.error("Failed to create interface HTML: %s", e, exc_info=True)
 
-            document.getElementById('searchBox').addEventListener('input', updateClusterDisplay);
-            document.getElementById('maxClusters').addEventListener('change', updateClusterDisplay);
+    def _write_if_changed(self, file_path: str, content: Union[str, bytes]) -> bool:
+        """
+        Schreibt eine Datei nur, wenn sich ihr Inhalt seit dem letzten
+        Schreiben geändert hat (Vergleich über einen BLAKE2b-Hash).
 
-            // This function will be called to update clusters data
-            function updateClusters(clusterData) {
-               // Implementation will be generated by Python
-            }
-            </script>
-            </body>
-            </html>
-           """
-        # Create a placeholder file
-        placeholder_html = """
-           <!DOCTYPE html>
-           <html>
-           <head>
-               <style>
-                   body {
-                   font-family: Arial, sans-serif;
-                   background-color: #222;
-                   color: #fff;
-                   display: flex;
-                   justify-content: center;
-                   align-items: center;
-                   height: 100vh;
-                   margin: 0;
-               }
-               .message {
-                   text-align: center;
-                   max-width: 600px;
-                   padding: 20px;
-                   }
-               </style>
-           </head>
-           <body>
-               <div class="message">
-               <h1>Reddit Graph Visualization</h1>
-               <p>Select one or more clusters from the sidebar to visualize the data.</p>
-               </div>
-           </body>
-           </html>
-           """
+        Args:
+            file_path: Zieldatei
+            content: Neuer Inhalt als Text oder bereits UTF-8-kodierte Bytes
 
-        try:
-            with open(path.join(self.web_dir, self.html_filename), 'w', encoding='utf-8') as f:
-                f.write(html)
-            with open(path.join(self.web_dir, "placeholder.html"), 'w', encoding='utf-8') as f:
-                f.write(placeholder_html)
-            logger.info("Created interface HTML files")
-        except Exception as e:
-            logger.error(f"Failed to create interface HTML: {e}", exc_info=True)
+        Returns:
+            bool: True, wenn die Datei geschrieben wurde
+        """
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        digest = blake2b(data, digest_size=16).digest()
+        if self._file_hashes.get(file_path) == digest:
+            return False
+
+        _write_atomic(file_path, data)
+        self._file_hashes[file_path] = digest
+        return True
 
     def update_interface_html(self) -> None:
         """Aktualisiert die Cluster-Liste in der Interface-HTML"""
         js_clusters_data: Dict[str, Dict[str, Any]] = {}
-        cluster_html = ""
+        cluster_parts: List[str] = []
 
         for search_term, info in self.clusters.items():
-            safe_name = ''.join(c if c.isalnum() else '_' for c in search_term)
+            safe_name = _safe_name(search_term)
             js_clusters_data[safe_name] = {
                 'name': search_term,
                 'nodeCount': info['node_count'],
@@ -955,7 +1734,7 @@ class RedditGraphVisualizer:
                 'selected': False
             }
 
-            cluster_html += f"""
+            cluster_parts.append(f"""
                 <div id="cluster-{safe_name}" class="cluster-item" 
                     onclick="(() => {{
                         clusters['{safe_name}'].selected = !clusters['{safe_name}'].selected;
@@ -966,12 +1745,16 @@ class RedditGraphVisualizer:
                         {info['node_count']} nodes, {info['edge_count']} connections
                     </div>
                 </div>
-                """
+                """)
+        cluster_html = "".join(cluster_parts)
+
+        # Cluster-Daten mit orjson serialisieren, falls verfügbar
+        cluster_json = _json_dumps(js_clusters_data).decode('utf-8')
 
         # Generate JavaScript to update clusters - MOVED OUTSIDE THE LOOP
         update_js = f"""
         function updateClusters() {{
-            const clusterData = {dumps(js_clusters_data)};
+            const clusterData = {cluster_json};
             Object.keys(clusterData).forEach(key => {{
                 clusters[key] = clusterData[key];
             }});
@@ -983,28 +1766,20 @@ class RedditGraphVisualizer:
         updateClusters();
         """
 
-        # Append this script to the end of the HTML file
+        # Cluster-Skript zwischen den zwischengespeicherten statischen Teilen einsetzen
         try:
             file_path = path.join(self.web_dir, self.html_filename)
-            with open(file_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-
-            # Replace the updateClusters function
-            updated_html = html_content.replace(
-                "function updateClusters(clusterData) {\n               // Implementation will be generated by Python\n            }",
-                update_js
-            )
-
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(updated_html)
+            updated_html = INTERFACE_HTML_PREFIX + update_js.encode('utf-8') + INTERFACE_HTML_SUFFIX
 
-            logger.info(f"Updated interface with {len(self.clusters)} clusters")
+            if self._write_if_changed(file_path, updated_html):
+                logger.info("Updated interface with %s clusters", len(self.clusters))
         except Exception as e:
-            logger.error(f"Failed to update interface HTML: {e}", exc_info=True)
+            logger.error("Failed to update interface HTML: %s", e, exc_info=True)
 
     def _process_data(self, data_items: Optional[List[Dict[str, Any]]] = None) -> None:
         """
-        Verarbeitet Daten aus beiden Quellen (Redis und JSON)
+        Verarbeitet Daten aus beiden Quellen (Redis und JSON) für den Hauptgraphen.
+        Die Cluster befüllt der Aufrufer bereits beim Einlesen.
 
         Args:
            data_items: Liste von Subreddit-Daten, entweder direkt aus Redis oder
@@ -1014,73 +1789,137 @@ class RedditGraphVisualizer:
             # Keine Daten angegeben, bestehende Cluster wiederherstellen
             return
 
+        # Attribute und Methoden für die Schleife einmalig lokal binden
+        added_nodes = self.added_nodes
+        added_edges = self.added_edges
+        min_size = self.MIN_SIZE
+        font_color = self.net.font_color
+        # Einzelne Knoten und Kanten werden nur auf DEBUG-Level protokolliert
+        debug = logger.isEnabledFor(LOG_DEBUG)
+
+        # Knoten und Kanten werden im Format von pyvis gesammelt und am Ende in
+        # einem Schritt übernommen. add_node/add_edge prüfen bei jedem Aufruf
+        # alle vorhandenen Kanten, die Duplikate filtern hier bereits die Sets.
+        new_nodes = []
+        new_edges = []
+
         for data in data_items:
             # Extrahiere den Subreddit-Namen
             subreddit_name = data.get("name")
             if not subreddit_name:
-                logger.warning(f"Skipping data item without name: {data}")
+                logger.warning("Skipping data item without name: %s", data)
                 continue
 
-            # Bestimme Search Term für dieses Subreddit
-            search_term = data.get("search_term", "unknown")
-
-            # Füge es zum entsprechenden Cluster hinzu
-            self._add_to_cluster(search_term, data)
-
             # Legacy-Support: Zum Hauptgraphen hinzufügen
             # Füge Hauptknoten hinzu
-            if subreddit_name not in self.added_nodes:
-                # Bestimme Knotenfarbe basierend auf NSFW-Status
-                color = "#ff0000" if data.get("nsfw", False) else "#00ff00"
-
-                # Berechne Knotengröße basierend auf search_term_count
-                weight = min(data.get("search_term_count", 1), self.MAX_WEIGHT)
-                size = self.MIN_SIZE + (weight / self.MAX_WEIGHT) * (self.MAX_SIZE - self.MIN_SIZE)
-
-                # Erstelle Tooltip-Text
-                title = (f"Related count: {data.get('related_count', 0)}\n"
-                         f"Search term count: {data.get('search_term_count', 1)}\n"
-                         f"NSFW: {data.get('nsfw', False)}")
-
-                self.net.add_node(
-                    subreddit_name,
-                    label=subreddit_name,
-                    title=title,
-                    size=size,
-                    color=color
-                )
-                self.added_nodes.add(subreddit_name)
-                logger.info(f"Added node: {subreddit_name}")
+            if subreddit_name not in added_nodes:
+                # Jedes Feld nur einmal auslesen
+                nsfw = bool(data.get("nsfw", False))
+                search_term_count = data.get("search_term_count", 1)
+
+                new_nodes.append({
+                    # Knotenfarbe basierend auf NSFW-Status
+                    'color': _NODE_COLOR[nsfw],
+                    # Tooltip-Text aus den Zählern
+                    'title': _node_title(data.get("related_count", 0), search_term_count, nsfw),
+                    # Knotengröße basierend auf search_term_count
+                    'size': _node_size(search_term_count),
+                    'id': subreddit_name,
+                    'label': subreddit_name,
+                    'shape': 'dot',
+                    'font': {'color': font_color}
+                })
+                added_nodes.add(subreddit_name)
+                if debug:
+                    logger.debug("Added node: %s", subreddit_name)
 
             # Verarbeite verwandte Subreddits
-            related_subreddits = data.get("related_subreddits", [])
-            for related in related_subreddits:
+            for related in data.get("related_subreddits") or ():
                 # Entferne r/ Prefix falls vorhanden
-                related_name = related.replace("r/", "") if related.startswith("r/") else related
+                related_name = _strip_r(related)
 
                 # Füge verwandten Knoten hinzu falls noch nicht vorhanden
-                if related_name not in self.added_nodes:
-                    self.net.add_node(
-                        related_name,
-                        label=related_name,
-                        size=self.MIN_SIZE,
-                        color="#ff9999"  # Hellrot für verwandte Knoten
-                    )
-                    self.added_nodes.add(related_name)
+                if related_name not in added_nodes:
+                    new_nodes.append({
+                        'color': "#ff9999",  # Hellrot für verwandte Knoten
+                        'size': min_size,
+                        'id': related_name,
+                        'label': related_name,
+                        'shape': 'dot',
+                        'font': {'color': font_color}
+                    })
+                    added_nodes.add(related_name)
 
                 # Füge Kante hinzu falls noch nicht vorhanden
-                edge = tuple(sorted([subreddit_name, related_name]))
-                if edge not in self.added_edges:
-                    self.net.add_edge(*edge, color="#ffffff")
-                    self.added_edges.add(edge)
-                    logger.info(f"Added edge: {subreddit_name} -> {related_name}")
-            logger.debug(f"Processed data: {data}")
-        logger.info(f"_process_data finished processing with {len(data_items) if data_items else 0} items")
-
-    @lru_cache(maxsize=10)
+                edge = ((subreddit_name, related_name) if subreddit_name < related_name
+                        else (related_name, subreddit_name))
+                if edge not in added_edges:
+                    new_edges.append({'color': "#ffffff", 'from': edge[0], 'to': edge[1]})
+                    added_edges.add(edge)
+                    if debug:
+                        logger.debug("Added edge: %s -> %s", subreddit_name, related_name)
+            if debug:
+                logger.debug("Processed data: %s", data)
+
+        # Gesammelte Knoten und Kanten gebündelt in das Netzwerk übernehmen
+        net = self.net
+        net.nodes.extend(new_nodes)
+        net.node_ids.extend(node['id'] for node in new_nodes)
+        net.node_map.update((node['id'], node) for node in new_nodes)
+        net.edges.extend(new_edges)
+        logger.info("_process_data finished processing with %d items (%d new nodes, %d new edges)",
+                    len(data_items), len(new_nodes), len(new_edges))
+
+    @staticmethod
+    def _read_sqlite_data(db_path: str) -> Dict[str, Any]:
+        """
+        Liest eine vom Crawler geschriebene SQLite-Datenbank und bringt sie in
+        dieselbe Struktur wie die JSON-Datei.
+
+        Args:
+            db_path: Pfad zur Datenbank
+
+        Returns:
+            Dict: Daten im Format {"root": {...}, "metadata": {...}}
+        """
+        if not path.exists(db_path):
+            raise FileNotFoundError(db_path)
+
+        # Nur lesend öffnen, der Crawler darf parallel weiterschreiben
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            root: Dict[str, Any] = {}
+            by_name: Dict[str, Dict[str, Any]] = {}
+            rows = conn.execute(
+                "SELECT name, search_term, search_term_count, related_count, nsfw "
+                "FROM subreddits ORDER BY rowid"
+            )
+            for name, search_term, search_term_count, related_count, nsfw in rows:
+                subreddit = {
+                    "name": name,
+                    "search_term_count": search_term_count,
+                    "related_count": related_count,
+                    "related_subreddits": [],
+                    "nsfw": bool(nsfw)
+                }
+                root.setdefault(search_term, {"subreddits": []})["subreddits"].append(subreddit)
+                by_name[name] = subreddit
+
+            for src, dst in conn.execute("SELECT src, dst FROM related"):
+                subreddit = by_name.get(src)
+                if subreddit is not None:
+                    subreddit["related_subreddits"].append(dst)
+
+            metadata = dict(conn.execute("SELECT key, value FROM metadata"))
+        finally:
+            conn.close()
+
+        return {"root": root, "metadata": metadata}
+
     def load_data_from_json(self, json_path: str) -> Dict[str, Any]:
         """
-           Liest eine JSON-Datei und erstellt den Graphen aus der neuen Struktur:
+           Liest eine JSON-Datei (oder eine SQLite-Datenbank des Crawlers)
+           und erstellt den Graphen aus der neuen Struktur:
            {
                "root": {
                    "search_term": {
@@ -1110,10 +1949,14 @@ class RedditGraphVisualizer:
                SystemExit: Bei Fehlern beim Laden oder Verarbeiten der Datei
         """
         try:
-            with open(json_path, 'r') as f:
-                data = json_load(f)
+            if json_path.endswith(SQLITE_SUFFIXES):
+                data = self._read_sqlite_data(json_path)
+            else:
+                with open(json_path, 'rb') as f:
+                    data = _json_loads(f.read())
 
-            # Sammle alle Subreddit-Daten
+            # Sammle alle Subreddit-Daten in einem Durchlauf für Cluster und Hauptgraph
+            all_subreddits = []
             for search_term, content in data["root"].items():
                 for subreddit in content["subreddits"]:
                     # Füge den Search Term zum Subreddit-Datensatz hinzu
@@ -1121,33 +1964,36 @@ class RedditGraphVisualizer:
 
                     # Füge es zum entsprechenden Cluster hinzu
                     self._add_to_cluster(search_term, subreddit)
+                    all_subreddits.append(subreddit)
+
+            # Alle Cluster erst nach dem vollständigen Einlesen speichern
+            self._save_clusters(set(data["root"]))
 
             # Update dem Interface-HTML
             self.update_interface_html()
 
             # Verarbeite für Legacy-Support alle Daten für den Hauptgraphen
-            all_subreddits = []
-            for search_term, content in data["root"].items():
-                for subreddit in content["subreddits"]:
-                    subreddit["search_term"] = search_term
-                    all_subreddits.append(subreddit)
-
             self._process_data(all_subreddits)
 
             # Speichere Zustand für spätere Wiederherstellung
             self.save_state()
+            self._state_dirty = True
 
             return data
         except FileNotFoundError:
-            logger.error(f"JSON file not found: {json_path}")
+            logger.error("JSON file not found: %s", json_path)
             self.cleanup()
             raise SystemExit(1)
         except JSONDecodeError:
-            logger.error(f"Invalid JSON format in file: {json_path}")
+            logger.error("Invalid JSON format in file: %s", json_path)
+            self.cleanup()
+            raise SystemExit(1)
+        except sqlite3.Error as e:
+            logger.error("Invalid SQLite database %s: %s", json_path, e)
             self.cleanup()
             raise SystemExit(1)
         except Exception as e:
-            logger.error(f"Unexpected error while loading JSON: {e}", exc_info=True)
+            logger.error("Unexpected error while loading JSON: %s", e, exc_info=True)
             self.cleanup()
             raise SystemExit(1)
 
@@ -1167,45 +2013,161 @@ class RedditGraphVisualizer:
             logger.warning("No clusters selected for visualization")
             return None
 
-        # Mapping von sanitierten Namen zu Original-Suchbegriffen
-        sanitized_to_original = {
-            ''.join(c if c.isalnum() else '_' for c in name): name
-            for name in self.clusters.keys()
-        }
-
         # Finde Original-Suchbegriffe für die ausgewählten Cluster
-        selected_search_terms = []
-        for name in cluster_names:
-            if name in self.clusters:
-                selected_search_terms.append(name)
-            elif name in sanitized_to_original:
-                selected_search_terms.append(sanitized_to_original[name])
+        selected_search_terms = self._resolve_cluster_names(cluster_names)
 
         if not selected_search_terms:
-            logger.error(f"Could not resolve any cluster names from {cluster_names}")
+            logger.error("Could not resolve any cluster names from %s", cluster_names)
             return None
 
-        logger.info(f"Creating visualization for selected search terms: {selected_search_terms}")
+        # Unveränderte Auswahl: vorhandene Datei wiederverwenden
+        view_key = self._view_key(selected_search_terms)
+        return self._build_view_once(
+            self._merged_views, view_key,
+            partial(self._create_merged_view, selected_search_terms, view_key)
+        )
+
+    def _create_merged_view(
+            self,
+            selected_search_terms: List[str],
+            view_key: FrozenSet[Tuple[str, int, int]]
+    ) -> Optional[str]:
+        """Erzeugt die kombinierte Visualisierung für merge_selected_clusters"""
+        logger.info("Creating visualization for selected search terms: %s", selected_search_terms)
 
         # Erstelle ein neues Netzwerk für die Visualisierung
         combined_net = self.create_network_with_options()
-        combined_nodes = set()
-        combined_edges = set()
 
-        # Sammle Subreddit-Daten nur für die ausgewählten Suchbegriffe
-        for search_term in selected_search_terms:
-            if search_term not in self.clusters:
-                continue
+        if len(selected_search_terms) == 1:
+            # Ein einzelner Cluster wird nicht kopiert, seine Sets werden direkt
+            # gelesen. Die Sperre verhindert Änderungen während der Iteration.
+            cluster = self.clusters[selected_search_terms[0]]
+            guard = cluster['lock']
+            combined_nodes = cluster['nodes']
+            combined_edges = cluster['edges']
+        else:
+            guard = nullcontext()
+            combined_nodes = set()
+
+            # Sammle Subreddit-Daten nur für die ausgewählten Suchbegriffe
+            selected_clusters = [self.clusters[term] for term in selected_search_terms if term in self.clusters]
+            for cluster in selected_clusters:
+                # Füge alle Knoten aus diesem Cluster hinzu
+                combined_nodes |= cluster['nodes']
+            combined_edges = self._merge_edge_keys(selected_clusters)
+
+        with guard:
+            # Kanten-Schlüssel sind eindeutig, die Namenspaare daher ebenfalls
+            combined_edges = list(map(self._edge_names, combined_edges))
+            self._fill_combined_network(combined_net, combined_nodes, combined_edges, selected_search_terms)
+            node_count = len(combined_nodes)
+            edge_count = len(combined_edges)
+
+        # Erstelle einen Dateinamen basierend auf den ausgewählten Suchbegriffen
+        filename_parts = [term.replace(' ', '_')[:20] for term in selected_search_terms[:3]]
+        filename_base = '_'.join(filename_parts)
+        if len(selected_search_terms) > 3:
+            filename_base += f"_and_{len(selected_search_terms) - 3}_more"
+
+        # Füge Anzahl der Knoten zum Dateinamen hinzu
+        combined_filename = (
+            f"combined_{filename_base}_{node_count}nodes_{int(time())}_{next(self._export_counter)}.html"
+        )
+        file_path = path.join(self.clusters_dir, combined_filename)
+
+        try:
+            # Füge den Knotenzähler hinzu
+            counter_html = f"""
+            <div style="position: fixed; top: 10px; right: 10px; background-color: rgba(0,0,0,0.7); 
+                        color: white; padding: 10px; border-radius: 5px; z-index: 1000;">
+                Nodes: {node_count} | Edges: {edge_count}
+            </div>
+            """
+
+            if self.render_backend == "sigma":
+                self._write_sigma_html(file_path, combined_net, counter_html)
+                logger.info("Created combined WebGL visualization with %s nodes and %s edges", node_count, edge_count)
+                relative_path = f"clusters/{combined_filename}"
+                self._remember_view(self._merged_views, view_key, relative_path)
+                return relative_path
+
+            # Den Zähler vor dem letzten </body> Tag einfügen, Knoten und Kanten
+            # werden als JSON-Bytes direkt in die Datei geschrieben
+            _stream_network_html(combined_net, file_path, counter_html)
+
+            logger.info("Created combined visualization with %s nodes and %s edges", node_count, edge_count)
+
+            # Gib den relativen Pfad zurück
+            relative_path = f"clusters/{combined_filename}"
+            self._remember_view(self._merged_views, view_key, relative_path)
+            return relative_path
+        except Exception as e:
+            logger.error("Failed to create combined visualization: %s", e, exc_info=True)
+            return None
+
+    @staticmethod
+    def _write_sigma_html(file_path: str, net: Network, counter_html: str) -> None:
+        """
+        Schreibt die Knoten und Kanten eines PyVis-Netzwerks als sigma.js-Seite,
+        die per WebGL auch sehr große Graphen flüssig darstellt.
+
+        Args:
+            file_path: Zieldatei
+            net: Netzwerk mit den zu übernehmenden Knoten und Kanten
+            counter_html: Overlay mit Knoten- und Kantenzahl
+        """
+        # Über eine temporäre Datei schreiben, damit nie eine halbe Datei sichtbar ist
+        with _atomic_open(file_path) as f:
+            f.write(SIGMA_HTML_HEAD.encode('utf-8'))
+            f.write(b"const nodes = " + _payload_json(net.nodes) + b";\n")
+            f.write(b"const edges = " + _payload_json(net.edges) + b";\n")
+            f.write(SIGMA_HTML_TAIL.encode('utf-8'))
+            f.write(counter_html.encode('utf-8'))
+            f.write(b"</body>\n</html>\n")
 
-            cluster = self.clusters[search_term]
+    @staticmethod
+    def _merge_edge_keys(clusters: List[Dict[str, Any]]) -> List[int]:
+        """
+        Vereinigt die Kanten-Schlüssel mehrerer Cluster ohne Duplikate. Mit
+        NumPy werden die Schlüssel als zusammenhängendes uint64-Array per
+        np.unique zusammengeführt statt über ein Python-Set.
 
-            # Füge alle Knoten und Kanten aus diesem Cluster hinzu
-            for node_id in cluster['nodes']:
-                combined_nodes.add(node_id)
+        Args:
+            clusters: Die ausgewählten Cluster
 
-            for edge in cluster['edges']:
-                combined_edges.add(edge)
+        Returns:
+            List[int]: Eindeutige Kanten-Schlüssel
+        """
+        if np is None or len(clusters) < 2:
+            merged: Set[int] = set()
+            for cluster in clusters:
+                merged |= cluster['edges']
+            return list(merged)
+
+        arrays = []
+        for cluster in clusters:
+            # Die Sperre verhindert, dass sich das Set während des Kopierens ändert
+            with cluster['lock']:
+                edges = cluster['edges']
+                arrays.append(np.fromiter(edges, dtype=np.uint64, count=len(edges)))
+        return np.unique(np.concatenate(arrays)).tolist()
+
+    def _fill_combined_network(
+            self,
+            combined_net: Network,
+            combined_nodes: Set[str],
+            combined_edges: List[Tuple[str, str]],
+            selected_search_terms: List[str]
+    ) -> None:
+        """
+        Überträgt die gesammelten Knoten und Kanten in das kombinierte Netzwerk.
 
+        Args:
+            combined_net: Zielnetzwerk der kombinierten Ansicht
+            combined_nodes: Namen aller Knoten der ausgewählten Cluster
+            combined_edges: Kanten als Namenspaare
+            selected_search_terms: Suchbegriffe der ausgewählten Cluster
+        """
         # Füge alle gesammelten Knoten zum Netzwerk hinzu
         for node_id in combined_nodes:
             # Suche nach Knotendetails in den ursprünglichen Clustern
@@ -1227,46 +2189,13 @@ class RedditGraphVisualizer:
                     size=self.MIN_SIZE
                 )
 
-        # Füge alle gesammelten Kanten zum Netzwerk hinzu
-        for source, target in combined_edges:
-            if source in combined_nodes and target in combined_nodes:
-                combined_net.add_edge(source, target, color="#ffffff")
-
-        # Erstelle einen Dateinamen basierend auf den ausgewählten Suchbegriffen
-        filename_parts = [term.replace(' ', '_')[:20] for term in selected_search_terms[:3]]
-        filename_base = '_'.join(filename_parts)
-        if len(selected_search_terms) > 3:
-            filename_base += f"_and_{len(selected_search_terms) - 3}_more"
-
-        # Füge Anzahl der Knoten zum Dateinamen hinzu
-        node_count = len(combined_nodes)
-        edge_count = len(combined_edges)
-        combined_filename = f"combined_{filename_base}_{node_count}nodes_{int(time())}.html"
-        file_path = path.join(self.clusters_dir, combined_filename)
-
-        try:
-            # Füge Metadaten zum HTML hinzu
-            html_content = combined_net.generate_html()
-            # Füge den Knotenzähler hinzu
-            counter_html = f"""
-            <div style="position: fixed; top: 10px; right: 10px; background-color: rgba(0,0,0,0.7); 
-                        color: white; padding: 10px; border-radius: 5px; z-index: 1000;">
-                Nodes: {node_count} | Edges: {edge_count}
-            </div>
-            """
-            # Füge den Zähler vor dem schließenden </body> Tag ein
-            html_content = html_content.replace('</body>', f'{counter_html}</body>')
-
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-
-            logger.info(f"Created combined visualization with {node_count} nodes and {edge_count} edges")
-
-            # Gib den relativen Pfad zurück
-            return f"clusters/{combined_filename}"
-        except Exception as e:
-            logger.error(f"Failed to create combined visualization: {e}", exc_info=True)
-            return None
+        # Füge alle gesammelten Kanten zum Netzwerk hinzu. _add_to_cluster legt
+        # beide Endknoten vor jeder Kante an und die Namenspaare sind eindeutig,
+        # daher werden die Kanten ohne die Prüfungen von add_edge übernommen.
+        combined_net.edges.extend(
+            {'color': "#ffffff", 'from': source, 'to': target}
+            for source, target in combined_edges
+        )
 
     def _find_node_details(self, node_id: str, search_terms: List[str]) -> Optional[Dict[str, Any]]:
         """
@@ -1280,13 +2209,14 @@ class RedditGraphVisualizer:
             Optional[Dict]: Knotendetails oder None, wenn nicht gefunden
         """
         for search_term in search_terms:
-            if search_term not in self.clusters:
+            cluster = self.clusters.get(search_term)
+            if cluster is None:
                 continue
 
-            cluster = self.clusters[search_term]
-            for node in cluster['network'].nodes:
-                if node['id'] == node_id:
-                    return node
+            # PyVis führt bereits ein Dictionary ID -> Knoten, kein linearer Durchlauf nötig
+            node = cluster['network'].node_map.get(node_id)
+            if node is not None:
+                return node
 
         return None
 
@@ -1316,21 +2246,19 @@ class RedditGraphVisualizer:
         valid_layouts = {"standard", "labels"}
 
         if resolution not in valid_resolutions:
-            logger.error(f"Ungültige Auflösung: {resolution}")
+            logger.error("Ungültige Auflösung: %s", resolution)
             return None
 
         if layout not in valid_layouts:
-            logger.error(f"Ungültiges Layout: {layout}")
+            logger.error("Ungültiges Layout: %s", layout)
             return None
 
         # Prüfe, ob notwendige Abhängigkeiten vorhanden sind
         try:
             from selenium import webdriver
             from selenium.webdriver.chrome.options import Options
-            from PIL import Image
-            from io import BytesIO
         except ImportError as e:
-            logger.error(f"Fehlende Abhängigkeit für Export: {e}")
+            logger.error("Fehlende Abhängigkeit für Export: %s", e)
             return None
 
         # Bildgröße bestimmen
@@ -1343,22 +2271,122 @@ class RedditGraphVisualizer:
         else:  # fullhd
             width, height = 1920, 1080  # Full HD
 
+        # Unveränderte Auswahl in gleicher Auflösung und gleichem Layout:
+        # das vorhandene Bild wird ohne Browser-Start wiederverwendet
+        selected_search_terms = self._resolve_cluster_names(cluster_names)
+        image_key = (self._view_key(selected_search_terms), resolution, layout)
+        return self._build_view_once(
+            self._image_views, image_key,
+            partial(self._create_image_export, cluster_names, width, height, resolution, layout, image_key)
+        )
+
+    def _create_image_export(
+            self,
+            cluster_names: List[str],
+            width: int,
+            height: int,
+            resolution: str,
+            layout: str,
+            image_key: Tuple[FrozenSet[Tuple[str, int, int]], str, str]
+    ) -> Optional[str]:
+        """Erstellt das Bild für export_clusters_as_image"""
         # Export-Verzeichnis erstellen
-        export_dir = path.join(self.web_dir, "exports")
-        makedirs(export_dir, exist_ok=True)
+        self._ensure_dir(self.exports_dir)
 
-        # Dateipfad generieren
+        # Dateipfad generieren, der Zähler trennt gleichzeitige Exporte derselben Sekunde
         timestamp = int(time())
-        export_filename = f"export_{resolution}_{layout}_{timestamp}.png"
-        export_path = path.join(export_dir, export_filename)
+        export_filename = f"export_{resolution}_{layout}_{timestamp}_{next(self._export_counter)}.png"
+        export_path = path.join(self.exports_dir, export_filename)
 
         try:
             # Standardansicht oder Labelansicht erstellen
-            return self._create_single_image(cluster_names, width, height, layout, export_path)
+            result = self._create_single_image(cluster_names, width, height, layout, export_path)
+            if result is not None:
+                self._remember_view(self._image_views, image_key, result)
+            return result
         except Exception as e:
-            logger.error(f"Fehler beim Bildexport: {e}", exc_info=True)
+            logger.error("Fehler beim Bildexport: %s", e, exc_info=True)
             return None
 
+    def export_clusters_as_image_batch(self, groups: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Exportiert mehrere voneinander unabhängige Cluster-Gruppen parallel.
+
+        Args:
+            groups: Liste von Dicts mit den Schlüsseln "clusters", "resolution"
+                    und "layout" (wie bei export_clusters_as_image)
+
+        Returns:
+            List[Optional[str]]: Pfade der exportierten Bilder in Reihenfolge der Gruppen
+        """
+        with ThreadPoolExecutor(max_workers=self.EXPORT_WORKERS, thread_name_prefix="export") as pool:
+            futures = [
+                pool.submit(
+                    self.export_clusters_as_image,
+                    group["clusters"],
+                    group.get("resolution", "fullhd"),
+                    group.get("layout", "standard")
+                )
+                for group in groups
+            ]
+            return [future.result() for future in futures]
+
+    def _acquire_driver(self) -> Any:
+        """
+        Liefert einen freien Chrome-Treiber aus dem Pool oder startet einen neuen.
+        Die Bildgröße wird pro Export über die DevTools festgelegt.
+
+        Returns:
+            Any: Einsatzbereiter Selenium-WebDriver
+        """
+        while True:
+            try:
+                driver = self._driver_pool.get_nowait()
+            except Empty:
+                break
+            # Ein abgestürzter Browser wird verworfen und durch einen neuen ersetzt
+            try:
+                driver.window_handles
+                return driver
+            except Exception as e:
+                logger.warning("Discarding unresponsive Chrome driver: %s", e)
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
+        # Chrome-Optionen konfigurieren
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-dev-shm-usage")  # Verhindert Speicherprobleme
+        chrome_options.add_argument("--no-sandbox")  # Für stabileren Betrieb in Containern
+        driver = webdriver.Chrome(options=chrome_options)
+
+        # Auf jeder geladenen Seite das Ende der Stabilisierung in window.__STAB__ festhalten
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": STABILIZATION_HOOK_JS})
+        except Exception as e:
+            logger.warning("Could not install stabilization hook: %s", e)
+        return driver
+
+    def _release_driver(self, driver: Any) -> None:
+        """Gibt einen Treiber an den Pool zurück, überzählige Treiber werden beendet"""
+        if self._driver_pool.qsize() < self.EXPORT_WORKERS:
+            try:
+                # Keine Sitzungsdaten in den nächsten Export mitnehmen
+                driver.delete_all_cookies()
+            except Exception as e:
+                logger.warning("Failed to reset Chrome driver, quitting it: %s", e)
+                driver.quit()
+                return
+            self._driver_pool.put(driver)
+        else:
+            driver.quit()
+
     def _create_single_image(
             self,
             cluster_names: List[str],
@@ -1380,25 +2408,16 @@ class RedditGraphVisualizer:
         Returns:
         Optional[str]: Relativer Pfad zum exportierten Bild oder None bei Fehler
         """
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        from PIL import Image
-        from io import BytesIO
-
-        # Chrome-Optionen konfigurieren
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-dev-shm-usage")  # Verhindert Speicherprobleme
-        chrome_options.add_argument("--no-sandbox")  # Für stabileren Betrieb in Containern
-        chrome_options.add_argument(f"--window-size={width},{height}")
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException
 
         try:
-            driver = webdriver.Chrome(options=chrome_options)
+            driver = self._acquire_driver()
         except Exception as e:
-            logger.error(f"Failed to initialize Chrome driver: {e}", exc_info=True)
+            logger.error("Failed to initialize Chrome driver: %s", e, exc_info=True)
             return None
 
+        reusable = True
         try:
             # Erzeugen der Visualisierung durch Zusammenführen ausgewählter Cluster
             combined_view = self.merge_selected_clusters(cluster_names)
@@ -1418,6 +2437,15 @@ class RedditGraphVisualizer:
             else:
                 url = f"http://localhost:{self.port}/{combined_view}"
 
+            # Viewport auf die Zielauflösung setzen, statt ein entsprechend
+            # großes Browserfenster zu öffnen
+            driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+                "width": width,
+                "height": height,
+                "deviceScaleFactor": 1,
+                "mobile": False
+            })
+
             # Seite laden
             driver.get(url)
 
@@ -1430,23 +2458,40 @@ class RedditGraphVisualizer:
                 wait_time = 60 + (width // 2000)  # Basis 10s + 1s pro 2000px Breite
                 wait_time *= len(cluster_names)  # Wait_time x count of clusters
 
-            logger.info(f"Waiting {wait_time}s for rendering to complete...")
-            sleep(wait_time)
-
-            # Screenshot erstellen
-            png_data = driver.get_screenshot_as_png()
-
-            # Als Bild speichern
-            img = Image.open(BytesIO(png_data))
-            img.save(export_path)
-
-            logger.info(f"Bild erfolgreich exportiert nach {export_path}")
+            # Die Wartezeit ist nur noch die Obergrenze, sobald die Physik-Simulation
+            # von vis.js zur Ruhe gekommen ist, wird fotografiert
+            logger.info("Waiting up to %ss for rendering to complete...", wait_time)
+            try:
+                WebDriverWait(driver, wait_time, poll_frequency=0.25).until(
+                    lambda d: d.execute_script(STABILIZATION_DONE_JS)
+                )
+            except TimeoutException:
+                logger.warning("Rendering not stabilized after %ss, taking screenshot anyway", wait_time)
+
+            # Screenshot über die DevTools erstellen, Chrome liefert bereits PNG
+            screenshot = driver.execute_cdp_cmd("Page.captureScreenshot", {
+                "format": "png",
+                "fromSurface": True,
+                "captureBeyondViewport": True,
+                "clip": {"x": 0, "y": 0, "width": width, "height": height, "scale": 1}
+            })
+
+            # Unverändert als Bild speichern
+            with open(export_path, 'wb') as f:
+                f.write(b64decode(screenshot["data"]))
+
+            logger.info("Bild erfolgreich exportiert nach %s", export_path)
             return f"exports/{path.basename(export_path)}"
         except Exception as e:
-            logger.error(f"Error during image capture: {e}", exc_info=True)
+            logger.error("Error during image capture: %s", e, exc_info=True)
+            # Der Treiber ist in unbekanntem Zustand und wird nicht wiederverwendet
+            reusable = False
             return None
         finally:
-            driver.quit()
+            if reusable:
+                self._release_driver(driver)
+            else:
+                driver.quit()
 
     def _generate_labeled_html(self, cluster_names: List[str]) -> Optional[str]:
         """
@@ -1460,22 +2505,25 @@ class RedditGraphVisualizer:
             Optional[str]: Relativer Pfad zur generierten HTML-Datei oder None bei Fehler
         """
         # Erst die Originalnamen der Cluster finden
-        sanitized_to_original = {
-            ''.join(c if c.isalnum() else '_' for c in name): name
-            for name in self.clusters.keys()
-        }
-
-        selected_search_terms = []
-        for name in cluster_names:
-            if name in self.clusters:
-                selected_search_terms.append(name)
-            elif name in sanitized_to_original:
-                selected_search_terms.append(sanitized_to_original[name])
+        selected_search_terms = self._resolve_cluster_names(cluster_names)
 
         if not selected_search_terms:
-            logger.error(f"Could not resolve any cluster names for labeled view: {cluster_names}")
+            logger.error("Could not resolve any cluster names for labeled view: %s", cluster_names)
             return None
 
+        # Unveränderte Auswahl: vorhandene Datei wiederverwenden
+        view_key = self._view_key(selected_search_terms)
+        return self._build_view_once(
+            self._labeled_views, view_key,
+            partial(self._create_labeled_view, selected_search_terms, view_key)
+        )
+
+    def _create_labeled_view(
+            self,
+            selected_search_terms: List[str],
+            view_key: FrozenSet[Tuple[str, int, int]]
+    ) -> Optional[str]:
+        """Erzeugt die Label-Ansicht für _generate_labeled_html"""
         # Erstelle ein neues Netzwerk für die zusammengeführten Cluster
         labeled_net = Network(
             height="100vh",
@@ -1485,143 +2533,240 @@ class RedditGraphVisualizer:
         )
 
         # Angepasste Optionen für große Labels
-        options = {
-            "physics": {
-                "enabled": True,
-                "solver": "forceAtlas2Based",  # Better solver for layout
-                "forceAtlas2Based": {
-                    "gravitationalConstant": -50,
-                    "centralGravity": 0.005,
-                    "springLength": 250,
-                    "springConstant": 0.05,
-                    "damping": 0.4,
-                    "avoidOverlap": 1.0
-                },
-                "stabilization": {
-                    "enabled": True,
-                    "iterations": 2500,
-                    "updateInterval": 25
-                },
-                "minVelocity": 0.5,
-                "maxVelocity": 50
-            },
-            "nodes": {
-                "font": {
-                    "size": 24,
-                    "face": "Arial",
-                    "color": "white",
-                    "strokeWidth": 2,
-                    "strokeColor": "#222222"
-                },
-                "scaling": {
-                    "min": 30,
-                    "max": 80
-                },
-                "shape": "box",
-                "margin": 15,
-                "widthConstraint": {
-                    "maximum": 150
-                },
-                "borderWidth": 2
-            },
-            "edges": {
-                "color": {
-                    "opacity": 0.7
-                },
-                "smooth": {
-                    "enabled": True,
-                    "type": "continuous"
-                },
-                "width": 1.5
-            },
-            "layout": {
-                "improvedLayout": True  # Disable for better performance
-            }
-        }
-
-        # Statt set_options zu verwenden, direkt options setzen
-        labeled_net.options = options
+        labeled_net.set_options(LABELED_OPTIONS_JSON)
 
         # Sammle alle Knoten und Kanten
         combined_nodes = set()
-        combined_edges = set()
+        selected_clusters = [self.clusters[term] for term in selected_search_terms if term in self.clusters]
+        for cluster in selected_clusters:
+            combined_nodes |= cluster['nodes']
 
-        for search_term in selected_search_terms:
-            if search_term not in self.clusters:
-                continue
+        combined_edges = list(map(self._edge_names, self._merge_edge_keys(selected_clusters)))
 
-            cluster = self.clusters[search_term]
-            for node_id in cluster['nodes']:
-                combined_nodes.add(node_id)
+        font_color = labeled_net.font_color
+        if len(combined_nodes) > LABELED_MAX_NODES and louvain_communities is not None:
+            # Zu große Graphen als Communities darstellen
+            logger.info("Labeled view has %s nodes, collapsing into communities", len(combined_nodes))
+            nodes_payload, edges_payload = self._community_payload(combined_nodes, combined_edges, font_color)
+        else:
+            # Anzeige-Daten kommen aus den spaltenweisen Caches der Cluster. Ein
+            # Knoten aus mehreren Clustern wird aus dem ersten übernommen. Die
+            # Überschneidung wird per Mengenschnitt bestimmt, bei disjunkten
+            # Clustern entfällt die Prüfung je Knoten.
+            nodes_payload = []
+            seen: Set[str] = set()
+            for search_term in selected_search_terms:
+                cluster = self.clusters[search_term]
+                with cluster['lock']:
+                    columns = self._labeled_columns(cluster)
+                    ids = columns['ids']
+                    labels = columns['labels']
+                    titles = columns['titles']
+                    colors = columns['colors']
+                    sizes = columns['scaled']
+                    duplicates = seen.intersection(ids)
+                    seen.update(ids)
+                    for i in range(len(ids)):
+                        node_id = ids[i]
+                        if duplicates and node_id in duplicates:
+                            continue
+                        nodes_payload.append({
+                            'color': colors[i],
+                            'title': titles[i],
+                            'size': sizes[i],
+                            'id': node_id,
+                            'label': labels[i],
+                            'shape': 'dot',
+                            'font': {'color': font_color}
+                        })
 
-            for edge in cluster['edges']:
-                combined_edges.add(edge)
+            # Kanten hinzufügen
+            edges_payload = [
+                {'color': "#ffffff", 'from': source, 'to': target}
+                for source, target in combined_edges
+            ]
+
+        labeled_net.nodes = nodes_payload
+        labeled_net.node_ids = [node['id'] for node in nodes_payload]
+        labeled_net.node_map = {node['id']: node for node in nodes_payload}
+        labeled_net.edges = edges_payload
+
+        # Der Dateiname leitet sich aus dem Inhalt ab: gleiche Daten ergeben
+        # dieselbe URL, eine vorhandene Datei wird nicht neu geschrieben
+        nodes_json = _payload_json(nodes_payload)
+        edges_json = _payload_json(edges_payload)
+        digest = blake2b(nodes_json, digest_size=8)
+        digest.update(edges_json)
+        digest.update(LABELED_OPTIONS_JSON.encode('utf-8'))
+        export_html = f"labeled_export_{digest.hexdigest()}.html"
+        file_path = path.join(self.web_dir, export_html)
 
-        # Füge alle gesammelten Knoten zum Netzwerk hinzu
-        added_nodes = set()
-        for node_id in combined_nodes:
-            # Suche nach Knotendetails in den ursprünglichen Clustern
-            node_details = self._find_node_details(node_id, selected_search_terms)
+        try:
+            if path.exists(file_path):
+                logger.info("Labeled HTML mit gleichem Inhalt vorhanden: %s", export_html)
+            else:
+                _stream_network_html(labeled_net, file_path, payload=(nodes_json, edges_json))
+                logger.info("Labeled HTML für Export erstellt: %s", export_html)
+            self._remember_view(self._labeled_views, view_key, export_html)
+            return export_html
+        except Exception as e:
+            logger.error("Fehler beim Erstellen der Labeled HTML: %s", e)
+            return None
 
-            if node_id not in added_nodes:
-                # Label-Text anpassen (wenn ursprünglich Tooltip-Infos vorhanden sind)
-                display_label = node_id
-                if node_details and 'title' in node_details:
-                    # Tooltip-Infos zum Label hinzufügen
-                    info_lines = node_details['title'].split('\n')
-                    display_label = f"{node_id}\n{info_lines[0]}"
+    def _prune_labeled_exports(self) -> None:
+        """Löscht Label-Exporte, die älter als LABELED_EXPORT_MAX_AGE sind"""
+        cutoff = time() - LABELED_EXPORT_MAX_AGE
+        removed = 0
+        for file_path in glob(path.join(self.web_dir, 'labeled_export_*.html')):
+            try:
+                if stat(file_path).st_mtime < cutoff:
+                    remove(file_path)
+                    removed += 1
+            except OSError as e:
+                logger.warning("Could not remove old labeled export %s: %s", file_path, e)
+        if removed:
+            logger.info("Removed %s old labeled exports", removed)
 
-                # Farbe und Größe bestimmen
-                color = node_details['color'] if node_details and 'color' in node_details else '#cccccc'
-                size = max(30, node_details['size'] * 1.5) if node_details and 'size' in node_details else 30
+    @staticmethod
+    def _labeled_columns(cluster: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Ergänzt die spaltenweisen Anzeige-Daten eines Clusters um die seit dem
+        letzten Export hinzugekommenen Knoten. Knoten ändern sich nach dem
+        Anlegen nicht mehr, daher genügt es, neue Einträge anzuhängen.
+        Muss unter der Sperre des Clusters aufgerufen werden.
 
-                labeled_net.add_node(
-                    node_id,
-                    label=display_label,
-                    title=node_details['title'] if node_details and 'title' in node_details else '',
-                    size=size,
-                    color=color
-                )
-                added_nodes.add(node_id)
+        Args:
+            cluster: Der Cluster
 
-        # Kanten hinzufügen
-        added_edges = set()
-        for edge in combined_edges:
-            if edge[0] in added_nodes and edge[1] in added_nodes and edge not in added_edges:
-                labeled_net.add_edge(edge[0], edge[1], color="#ffffff")
-                added_edges.add(edge)
+        Returns:
+            Dict: Listen ids, labels, titles, colors, die Roh-Größen sizes und
+                  die für Labels vergrößerten Werte scaled
+        """
+        columns = cluster['labeled']
+        start = len(columns['ids'])
+        for node in cluster['network'].nodes[start:]:
+            node_id = node['id']
+            title = node.get('title')
+            columns['ids'].append(node_id)
+            if title is not None:
+                # Erste Tooltip-Zeile zum Label hinzufügen
+                first_line = title.partition('\n')[0]
+                columns['labels'].append(f"{node_id}\n{first_line}")
+                columns['titles'].append(title)
+            else:
+                columns['labels'].append(node_id)
+                columns['titles'].append('')
+            columns['colors'].append(node.get('color', '#cccccc'))
+            columns['sizes'].append(node.get('size', 20))
+
+        # Label-Größen nur für neue Knoten berechnen, mit NumPy in einem Schritt
+        sizes = columns['sizes']
+        if len(sizes) > start:
+            if np is not None:
+                # Über eine Kopie des Ausschnitts, sonst ließe sich das array nicht mehr vergrößern
+                raw = np.frombuffer(sizes[start:], dtype=np.float64)
+                columns['scaled'].extend(np.maximum(30.0, raw * 1.5).tolist())
+            else:
+                columns['scaled'].extend(max(30.0, size * 1.5) for size in sizes[start:])
+        return columns
 
-        # HTML speichern
-        export_html = f"labeled_export_{int(time())}.html"
-        file_path = path.join(self.web_dir, export_html)
+    @staticmethod
+    def _community_payload(
+            combined_nodes: Set[str],
+            combined_edges: List[Tuple[str, str]],
+            font_color: str
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Fasst einen großen Graphen per Louvain-Verfahren zu Communities zusammen.
+        Jede Community wird ein Meta-Knoten, dessen Größe ihrer Mitgliederzahl
+        folgt. Kanten zwischen Communities tragen die Anzahl der Verbindungen.
 
-        try:
-            html_content = labeled_net.generate_html()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            logger.info(f"Labeled HTML für Export erstellt: {export_html}")
-            return export_html
-        except Exception as e:
-            logger.error(f"Fehler beim Erstellen der Labeled HTML: {e}")
-            return None
+        Args:
+            combined_nodes: Namen aller Knoten
+            combined_edges: Kanten als Namenspaare
+            font_color: Schriftfarbe der Knoten
+
+        Returns:
+            Tuple[List, List]: Knoten und Kanten im Format von pyvis
+        """
+        graph = NxGraph()
+        graph.add_nodes_from(combined_nodes)
+        graph.add_edges_from(combined_edges)
+        communities = louvain_communities(graph, seed=0)
+
+        nodes_payload = []
+        community_of: Dict[str, int] = {}
+        for index, members in enumerate(communities):
+            for member in members:
+                community_of[member] = index
+
+            # Die am stärksten vernetzten Subreddits benennen die Community
+            top = sorted(members, key=graph.degree, reverse=True)[:10]
+            nodes_payload.append({
+                'color': '#cccccc',
+                'title': "\n".join(top) + (f"\n+{len(members) - len(top)} more" if len(members) > len(top) else ""),
+                'value': len(members),
+                'id': f"community-{index}",
+                'label': f"{top[0]}\n{len(members)} subreddits",
+                'shape': 'dot',
+                'font': {'color': font_color}
+            })
+
+        # Verbindungen zwischen Communities zählen, interne Kanten entfallen
+        weights: Counter = Counter()
+        for source, target in combined_edges:
+            a, b = community_of[source], community_of[target]
+            if a != b:
+                weights[(a, b) if a < b else (b, a)] += 1
+
+        edges_payload = [
+            {'color': "#ffffff", 'from': f"community-{a}", 'to': f"community-{b}",
+             'value': count, 'title': f"{count} connections"}
+            for (a, b), count in weights.items()
+        ]
+        return nodes_payload, edges_payload
 
     def cleanup(self) -> None:
         """
         Räumt Ressourcen auf beim Beenden des Programms.
         Stoppt den HTTP-Server ordnungsgemäß.
         """
+        # Ausstehende Cluster noch vollständig schreiben
+        if hasattr(self, '_io_pool'):
+            self._io_pool.shutdown(wait=True)
+
+        # Aufbewahrte Chrome-Treiber beenden
+        if hasattr(self, '_driver_pool'):
+            while True:
+                try:
+                    driver = self._driver_pool.get_nowait()
+                except Empty:
+                    break
+                try:
+                    driver.quit()
+                except Exception as e:
+                    logger.warning("Failed to quit Chrome driver: %s", e)
+
+        # Vollständigen Zustand nur sichern, wenn in diesem Lauf Daten erfolgreich
+        # verarbeitet wurden. Bei einem Ladefehler bleibt der alte Stand erhalten.
+        if getattr(self, '_state_dirty', False):
+            try:
+                self.checkpoint_state()
+            except Exception as e:
+                logger.error("Failed to save graph state: %s", e, exc_info=True)
+
         if hasattr(self, 'httpd'):
             self.httpd.shutdown()
             self.httpd.server_close()
             logger.info("HTTP server stopped")
             # Wenn mit Redis verbunden, trenne die Verbindung
             if self.use_server and self.redis_client:
-                # Redis leeren, wenn nicht bereits geschehen
-                while True:
-                    data = self.redis_client.lpop(self.queue_name)
-                    if not data:
-                        break
+                # Redis leeren, wenn nicht bereits geschehen. Die Einträge werden
+                # verworfen, daher genügt ein einzelnes DEL statt LPOP je Eintrag
+                self.redis_client.delete(self.queue_name)
                 self.redis_client.close()
+                if self._redis_pool is not None:
+                    self._redis_pool.disconnect()
                 logger.info("Redis connection closed")
 
                 # Setze Variablen zurück
@@ -1647,12 +2792,18 @@ class RedditGraphVisualizer:
             if initial_data_loaded:
                 webb_open(f'http://localhost:{self.port}/{self.html_filename}')
 
-            # Hauptschleife
+            # Hauptschleife: BLPOP wartet bei leerer Queue serverseitig auf neue
+            # Daten, ein Timeout von einer Sekunde hält Strg+C reaktionsfähig
             if self.use_server:
+                failures = 0
                 while True:
-                    if self.update_graph():
-                        continue
-                    sleep(2)
+                    if not self.update_graph(block=True) and self._update_failed:
+                        # Nach Fehlern exponentiell länger warten (0,25 s bis 16 s),
+                        # der Zufallsanteil verhindert gleichzeitige Wiederholungen
+                        failures += 1
+                        sleep(min(16.0, 0.25 * (1 << min(failures, 6))) + random() * 0.1)
+                    else:
+                        failures = 0
             else:
                 logger.info("Running in JSON-only mode. Please reload the page manually when needed.")
                 while True:
@@ -1667,15 +2818,17 @@ def main() -> None:
     parser = ArgumentParser(description="Reddit Graph Visualizer")
     parser.add_argument("--server", action="store_true",
                         help="Verbindung zu Redis herstellen und Daten abrufen.")
-    parser.add_argument("--json", type=str, help="Pfad zu einer JSON-Datei zum einmaligen Laden von Daten.")
+    parser.add_argument("--json", type=str, help="Pfad zu einer JSON-Datei oder SQLite-Datenbank (.db/.sqlite) zum einmaligen Laden von Daten.")
     parser.add_argument("--port", type=int, default=8000, help="HTTP-Server-Port (Standard: 8000)")
+    parser.add_argument("--renderer", choices=("pyvis", "sigma"), default="pyvis",
+                        help="Darstellung kombinierter Ansichten: pyvis (vis.js) oder sigma (WebGL, für große Graphen)")
     args = parser.parse_args()
 
     if not args.server and not args.json:
         print("Fehler: Du musst entweder --server oder --json <Pfad> angeben.")
         raise SystemExit(1)
 
-    visualizer = RedditGraphVisualizer(use_server=args.server)
+    visualizer = RedditGraphVisualizer(use_server=args.server, render_backend=args.renderer)
 
     # Set custom port if provided
     if args.port != 8000: